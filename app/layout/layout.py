@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import base64
+import html
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict
 
 import streamlit as st
 
 from app.utils.branding_assets import resolve_asset_path
+from app.utils.navigation import get_nav_sections
 
 
 def get_theme_tokens(theme: str) -> Dict[str, Dict[str, str]]:
@@ -621,75 +624,41 @@ def render_header(version: str, logo_b64: str) -> None:
 
 import datetime as _dt
 
-_CURRENT_YEAR = _dt.datetime.now(_dt.timezone.utc).year
+def _current_year() -> int:
+    """Current UTC year, read when the footer renders rather than at import."""
+    return _dt.datetime.now(_dt.timezone.utc).year
 
 
-def _build_footer_nav_links() -> str:
-    """Generate footer navigation ``<li>`` items from the centralized config.
-
-    The links mirror the sidebar navigation defined in
-    ``app/utils/navigation.py  NAV_SECTIONS``.  To add or remove a nav entry
-    edit **only** that list  the footer updates automatically.
-    """
-    from app.utils.navigation import get_nav_sections
-
-    lines = []
-    for _, items in get_nav_sections():
-        for label, page_key, icon in items:
-            if page_key == "legal":
-                continue
-            lines.append(
-                f'<li><a href="?page={page_key}#mantis-top">'
-                f'<span class="mantis-footer-icon">{icon}</span> {label}</a></li>'
-            )
-    return "\n            ".join(lines)
+def __getattr__(name: str):
+    # ``_CURRENT_YEAR`` used to be computed at import; resolve it on access so
+    # importing this module does not read the clock.
+    if name == "_CURRENT_YEAR":
+        return _current_year()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def render_footer(
-    version: str,
-    support_url: str = "https://github.com/bigmanjer/Mantis-Studio/issues",
-    contact_email: str = "rebusinessmatters@gmail.com",
-) -> None:
-    nav_links_html = _build_footer_nav_links()
-    brand_logo_src = ""
-    try:
-        assets_dir = Path(__file__).resolve().parents[2] / "assets"
-        logo_path = (
-            resolve_asset_path(assets_dir, "branding/mantis_footmark.png")
-            or resolve_asset_path(assets_dir, "mantis_footmark.png")
-            or resolve_asset_path(assets_dir, "branding/mantis_wordmark.png")
-            or resolve_asset_path(assets_dir, "mantis_wordmark.png")
-            or resolve_asset_path(assets_dir, "branding/mantis_lockup.png")
-            or resolve_asset_path(assets_dir, "mantis_lockup.png")
-            or resolve_asset_path(assets_dir, "mantis_banner_dark.png")
-        )
-        if logo_path and logo_path.exists():
-            payload = base64.b64encode(logo_path.read_bytes()).decode("utf-8")
-            brand_logo_src = f"data:image/png;base64,{payload}"
-    except Exception:
-        brand_logo_src = ""
-    st.html(
-        f"""
+# Static footer stylesheet; only the markup below is formatted per call.
+_FOOTER_CSS = """
     <style>
     /*  Footer container  */
-    .mantis-footer {{
+    .mantis-footer {
         margin-top: 4rem;
         border-top: 1px solid var(--mantis-divider, #143023);
         background: var(--mantis-surface-alt, rgba(5,14,11,0.9));
         padding: 2.5rem 1.5rem 0;
-    }}
+    }
 
     /*  Grid  */
-    .mantis-footer-grid {{
+    .mantis-footer-grid {
         display: grid;
         grid-template-columns: 1.6fr 1fr 1fr 1fr;
         gap: 2.5rem;
         max-width: 960px;
         margin: 0 auto;
-    }}
+    }
 
     /*  Section headings  */
-    .mantis-footer-section h4 {{
+    .mantis-footer-section h4 {
         font-family: 'Space Grotesk', sans-serif;
         font-size: 0.7rem;
         font-weight: 700;
@@ -699,20 +668,20 @@ def render_footer(
         margin: 0 0 0.85rem;
         padding-bottom: 0.45rem;
         border-bottom: 1px solid var(--mantis-divider, #143023);
-    }}
+    }
 
     /*  Lists  */
-    .mantis-footer-section ul {{
+    .mantis-footer-section ul {
         list-style: none;
         margin: 0;
         padding: 0;
-    }}
-    .mantis-footer-section li {{
+    }
+    .mantis-footer-section li {
         margin-bottom: 0.45rem;
-    }}
+    }
 
     /*  Links  */
-    .mantis-footer-section a {{
+    .mantis-footer-section a {
         color: var(--mantis-text, #ecfdf5);
         text-decoration: none;
         font-size: 0.85rem;
@@ -722,56 +691,56 @@ def render_footer(
         padding: 0.15rem 0;
         border-bottom: 1px solid transparent;
         transition: color 0.15s, border-color 0.15s;
-    }}
-    .mantis-footer-section a:hover {{
+    }
+    .mantis-footer-section a:hover {
         color: var(--mantis-accent, #22c55e);
         border-bottom-color: var(--mantis-accent, #22c55e);
-    }}
-    .mantis-footer-section a:focus-visible {{
+    }
+    .mantis-footer-section a:focus-visible {
         outline: 2px solid var(--mantis-accent, #22c55e);
         outline-offset: 2px;
         border-radius: 2px;
-    }}
-    .mantis-footer-section a .mantis-footer-icon {{
+    }
+    .mantis-footer-section a .mantis-footer-icon {
         font-size: 0.9rem;
         line-height: 1;
         flex-shrink: 0;
-    }}
-    .mantis-footer-section a .mantis-footer-ext {{
+    }
+    .mantis-footer-section a .mantis-footer-ext {
         font-size: 0.7rem;
         opacity: 0.55;
-    }}
+    }
 
     /*  Brand  */
-    .mantis-footer-brand {{
+    .mantis-footer-brand {
         font-size: 0.85rem;
         color: var(--mantis-muted, #9CA3AF);
         line-height: 1.7;
-    }}
-    .mantis-footer-brand strong {{
+    }
+    .mantis-footer-brand strong {
         color: var(--mantis-text, #ecfdf5);
         font-family: 'Space Grotesk', sans-serif;
         font-size: 1rem;
         font-weight: 700;
         letter-spacing: 0.03em;
-    }}
-    .mantis-footer-brand .mantis-footer-tagline {{
+    }
+    .mantis-footer-brand .mantis-footer-tagline {
         display: block;
         margin-top: 0.15rem;
         font-size: 0.8rem;
         color: var(--mantis-muted, #9CA3AF);
-    }}
-    .mantis-footer-brand .mantis-footer-logo {{
+    }
+    .mantis-footer-brand .mantis-footer-logo {
         display: block;
         width: min(210px, 100%);
         height: auto;
         margin: 0 0 0.7rem;
         opacity: 0.95;
         filter: drop-shadow(0 8px 16px rgba(0,0,0,0.32));
-    }}
+    }
 
     /*  Bottom bar  */
-    .mantis-footer-bottom {{
+    .mantis-footer-bottom {
         max-width: 960px;
         margin: 2rem auto 0;
         padding: 1rem 0;
@@ -783,40 +752,99 @@ def render_footer(
         color: var(--mantis-muted, #9CA3AF);
         flex-wrap: wrap;
         gap: 0.5rem;
-    }}
-    .mantis-footer-bottom a {{
+    }
+    .mantis-footer-bottom a {
         color: var(--mantis-muted, #9CA3AF);
         text-decoration: none;
         transition: color 0.15s;
-    }}
-    .mantis-footer-bottom a:hover {{
+    }
+    .mantis-footer-bottom a:hover {
         color: var(--mantis-accent, #22c55e);
-    }}
-    .mantis-footer-bottom a:focus-visible {{
+    }
+    .mantis-footer-bottom a:focus-visible {
         outline: 2px solid var(--mantis-accent, #22c55e);
         outline-offset: 2px;
         border-radius: 2px;
-    }}
+    }
 
     /*  Responsive  */
-    @media (max-width: 768px) {{
-        .mantis-footer {{ padding: 2rem 1rem 0; }}
-        .mantis-footer-grid {{
+    @media (max-width: 768px) {
+        .mantis-footer { padding: 2rem 1rem 0; }
+        .mantis-footer-grid {
             grid-template-columns: 1fr 1fr;
             gap: 1.75rem;
-        }}
-    }}
-    @media (max-width: 480px) {{
-        .mantis-footer-grid {{
+        }
+    }
+    @media (max-width: 480px) {
+        .mantis-footer-grid {
             grid-template-columns: 1fr;
             gap: 1.5rem;
-        }}
-        .mantis-footer-bottom {{
+        }
+        .mantis-footer-bottom {
             flex-direction: column;
             text-align: center;
-        }}
-    }}
+        }
+    }
     </style>
+"""
+
+
+_FOOTER_NAV_ITEM = (
+    '<li><a href="?page={page_key}#mantis-top">'
+    '<span class="mantis-footer-icon">{icon}</span> {label}</a></li>'
+)
+
+
+@lru_cache(maxsize=1)
+def _build_footer_nav_links() -> str:
+    """Generate footer navigation ``<li>`` items from the centralized config.
+
+    The links mirror the sidebar navigation defined in
+    ``app/utils/navigation.py  NAV_SECTIONS``.  To add or remove a nav entry
+    edit **only** that list  the footer updates automatically.
+    NAV_SECTIONS is fixed for the life of the process, so the markup is
+    built once.
+    """
+    return "\n            ".join(
+        _FOOTER_NAV_ITEM.format(page_key=page_key, icon=icon, label=label)
+        for _, items in get_nav_sections()
+        for label, page_key, icon in items
+        if page_key != "legal"
+    )
+
+
+@lru_cache(maxsize=8)
+def _render_footer_html(
+    version: str,
+    support_url: str,
+    contact_email: str,
+    year: int,
+) -> str:
+    """Assemble the footer markup; its inputs rarely change within a process."""
+    version = html.escape(version, quote=True)
+    support_url = html.escape(support_url, quote=True)
+    contact_email = html.escape(contact_email, quote=True)
+    nav_links_html = _build_footer_nav_links()
+    brand_logo_src = ""
+    try:
+        assets_dir = Path(__file__).resolve().parents[2] / "assets"
+        logo_path = (
+            resolve_asset_path(assets_dir, "branding/mantis_footmark.png")
+            or resolve_asset_path(assets_dir, "mantis_footmark.png")
+            or resolve_asset_path(assets_dir, "branding/mantis_wordmark.png")
+            or resolve_asset_path(assets_dir, "mantis_wordmark.png")
+            or resolve_asset_path(assets_dir, "branding/mantis_lockup.png")
+            or resolve_asset_path(assets_dir, "mantis_lockup.png")
+            or resolve_asset_path(assets_dir, "mantis_banner_dark.png")
+        )
+        if logo_path and logo_path.exists():
+            payload = base64.b64encode(logo_path.read_bytes()).decode("utf-8")
+            brand_logo_src = f"data:image/png;base64,{payload}"
+    except Exception:
+        brand_logo_src = ""
+    return (
+        _FOOTER_CSS
+        + f"""
     <footer class="mantis-footer" role="contentinfo" aria-label="Site footer">
       <div class="mantis-footer-grid">
         <div class="mantis-footer-section mantis-footer-brand">
@@ -841,18 +869,28 @@ def render_footer(
         <nav class="mantis-footer-section" aria-label="Support">
           <h4>Support</h4>
           <ul>
-            <li><a href="?page=help#mantis-top"><span class="mantis-footer-icon">&#9432;</span> Help</a></li>
-            <li><a href="{support_url}" target="_blank" rel="noopener noreferrer">Report an Issue <span class="mantis-footer-ext">&#8599;</span></a></li>
-            <li><a href="mailto:{contact_email}"><span class="mantis-footer-icon">&#9993;</span> Contact</a></li>
+            <li><a href="?page=help#mantis-top"><span class="mantis-footer-icon">ⓘ</span> Help</a></li>
+            <li><a href="{support_url}" target="_blank" rel="noopener noreferrer">Report an Issue <span class="mantis-footer-ext">↗</span></a></li>
+            <li><a href="mailto:{contact_email}"><span class="mantis-footer-icon">✉</span> Contact</a></li>
           </ul>
         </nav>
       </div>
       <div class="mantis-footer-bottom">
-        <span>&copy; {_CURRENT_YEAR} MANTIS Studio &middot; v{version}</span>
+        <span>© {year} MANTIS Studio · v{version}</span>
         <span>
           <a href="{support_url}" target="_blank" rel="noopener noreferrer" aria-label="MANTIS Studio on GitHub">GitHub</a>
         </span>
       </div>
     </footer>
-    """,
+    """
     )
+
+
+def render_footer(
+    version: str,
+    support_url: str = "https://github.com/bigmanjer/Mantis-Studio/issues",
+    contact_email: str = "rebusinessmatters@gmail.com",
+) -> None:
+    # The year is part of the cache key so a long-running server rolls the
+    # copyright line over at New Year instead of keeping the import-time value.
+    st.html(_render_footer_html(version, support_url, contact_email, _current_year()))
@@ -1,7 +1,7 @@
 ﻿from __future__ import annotations
 
 import logging
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, Mapping, Tuple
 
 from app.views.ai_tools import render_ai_settings
 from app.views.editor import render_chapters
@@ -17,7 +17,7 @@ logger = logging.getLogger("MANTIS")
 PageRenderer = Callable[[object], None]
 
 
-def get_nav_config(has_project: bool) -> Tuple[List[str], Dict[str, str]]:
+def get_nav_config(has_project: bool) -> Tuple[Tuple[str, ...], Mapping[str, str]]:
     """Get navigation configuration from the canonical navigation module."""
     from app.utils.navigation import get_nav_config as _get_nav_config
 
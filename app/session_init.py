@@ -192,15 +192,17 @@ def initialize_session_state(st) -> None:
         st.session_state.setdefault("groq_connection_tested", bool(config_data.get("groq_connection_tested")))
         
         # Resolve and set API keys (always refresh on each run)
-        st.session_state.openai_api_key = _resolve_api_key(st, "openai", config_data, AppConfig.OPENAI_API_KEY)
-        st.session_state.groq_api_key = _resolve_api_key(st, "groq", config_data, AppConfig.GROQ_API_KEY)
+        openai_key = _resolve_api_key(st, "openai", config_data, AppConfig.OPENAI_API_KEY)
+        groq_key = _resolve_api_key(st, "groq", config_data, AppConfig.GROQ_API_KEY)
+        st.session_state.openai_api_key = openai_key
+        st.session_state.groq_api_key = groq_key
         
         # Update AppConfig with session values
         AppConfig.GROQ_API_URL = st.session_state.groq_base_url
-        AppConfig.GROQ_API_KEY = st.session_state.groq_api_key
+        AppConfig.GROQ_API_KEY = groq_key
         AppConfig.DEFAULT_MODEL = st.session_state.groq_model
         AppConfig.OPENAI_API_URL = st.session_state.openai_base_url
-        AppConfig.OPENAI_API_KEY = st.session_state.openai_api_key
+        AppConfig.OPENAI_API_KEY = openai_key
         AppConfig.OPENAI_MODEL = st.session_state.openai_model
         
         logger.info("Session state initialized successfully")
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import re
 from contextlib import contextmanager
-from collections.abc import Generator
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from app.config.settings import AppConfig
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
 
 def _safe_int(value: object, default: int) -> int:
     """Parse *value* as an integer, returning *default* on failure."""
@@ -23,22 +26,77 @@ def _safe_float(value: object, default: float) -> float:
         return default
 
 
+# Streamlit widgets that receive auto-generated keys, as (attribute, has_label).
+_KEYED_WIDGETS: Tuple[Tuple[str, bool], ...] = (
+    ("text_input", True),
+    ("text_area", True),
+    ("number_input", True),
+    ("selectbox", True),
+    ("multiselect", True),
+    ("slider", True),
+    ("radio", True),
+    ("checkbox", True),
+    ("button", True),
+    ("file_uploader", True),
+    ("download_button", True),
+    ("expander", True),
+    ("form", True),
+    ("form_submit_button", True),
+    ("toggle", True),
+    ("feedback", True),
+    ("date_input", True),
+    ("time_input", True),
+    ("color_picker", True),
+    ("camera_input", True),
+    ("audio_input", True),
+    ("chat_input", False),
+)
+
+# state.py is imported once per Streamlit process, so compiling here is a
+# one-off cost rather than a per-widget lookup in the regex cache.
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Session-state slots holding the per-session auto-key counters and key-scope
+# stack. The helpers are installed once per process and shared by every
+# session, so neither may live in their closure.
+_WIDGET_COUNTERS_KEY = "_mantis_widget_counters"
+_KEY_PREFIX_STACK_KEY = "_mantis_key_prefix_stack"
+
+
 def ui_key(name: str) -> str:
     """Stable widget key helper (returns the same key string)."""
     return name
 
 
 def install_key_helpers(st) -> Tuple[contextmanager, Dict[Tuple[str, str, str], int]]:
-    widget_counters: Dict[Tuple[str, str, str], int] = {}
-    key_prefix_stack: List[str] = []
+    # Widgets stay wrapped across reruns, so after the first install the
+    # helpers are reused as-is and only the per-session counters are reset.
+    if getattr(st, "_mantis_keyhelpers_installed", False):
+        key_scope, counters_for = st._mantis_keyhelpers_retval
+        widget_counters = counters_for()
+        widget_counters.clear()
+        return key_scope, widget_counters
+
+    fallback_counters: Dict[Tuple[str, str, str], int] = {}
+    fallback_prefix_stack: List[str] = []
+
+    def _counters_for() -> Dict[Tuple[str, str, str], int]:
+        session_state = getattr(st, "session_state", None)
+        if session_state is None:
+            return fallback_counters
+        return session_state.setdefault(_WIDGET_COUNTERS_KEY, {})
+
+    def _prefix_stack() -> List[str]:
+        session_state = getattr(st, "session_state", None)
+        if session_state is None:
+            return fallback_prefix_stack
+        return session_state.setdefault(_KEY_PREFIX_STACK_KEY, [])
 
     def _current_prefix() -> str:
-        return "__".join(key_prefix_stack) or "global"
+        return "__".join(_prefix_stack()) or "global"
 
     def _slugify(value: str) -> str:
-        import re
-
-        slug = re.sub(r"[^a-z0-9]+", "_", (value or "").lower()).strip("_")
+        slug = _SLUG_RE.sub("_", (value or "").lower()).strip("_")
         return slug[:40] or "widget"
 
     def _auto_key(widget_type: str, label: Optional[str], key: Optional[str]) -> str:
@@ -47,17 +105,19 @@ def install_key_helpers(st) -> Tuple[contextmanager, Dict[Tuple[str, str, str],
         prefix = _current_prefix()
         slug = _slugify(label or widget_type)
         counter_key = (prefix, widget_type, slug)
+        widget_counters = _counters_for()
         widget_counters[counter_key] = widget_counters.get(counter_key, 0) + 1
         index = widget_counters[counter_key]
         return f"{prefix}__{slug}__{index}"
 
     @contextmanager
     def key_scope(prefix: str) -> Generator[None, None, None]:
-        key_prefix_stack.append(prefix)
+        stack = _prefix_stack()
+        stack.append(prefix)
         try:
             yield
         finally:
-            key_prefix_stack.pop()
+            stack.pop()
 
     def _wrap_widget(widget_fn, widget_type: str):
         def _wrapped(label=None, *args, **kwargs):
@@ -88,30 +148,26 @@ def install_key_helpers(st) -> Tuple[contextmanager, Dict[Tuple[str, str, str],
         else:
             setattr(st, attr, _wrap_widget_no_label(widget, widget_type))
 
-    _maybe_wrap("text_input", "text_input")
-    _maybe_wrap("text_area", "text_area")
-    _maybe_wrap("number_input", "number_input")
-    _maybe_wrap("selectbox", "selectbox")
-    _maybe_wrap("multiselect", "multiselect")
-    _maybe_wrap("slider", "slider")
-    _maybe_wrap("radio", "radio")
-    _maybe_wrap("checkbox", "checkbox")
-    _maybe_wrap("button", "button")
-    _maybe_wrap("file_uploader", "file_uploader")
-    _maybe_wrap("download_button", "download_button")
-    _maybe_wrap("expander", "expander")
-    _maybe_wrap("form", "form")
-    _maybe_wrap("form_submit_button", "form_submit_button")
-    _maybe_wrap("toggle", "toggle")
-    _maybe_wrap("feedback", "feedback")
-    _maybe_wrap("date_input", "date_input")
-    _maybe_wrap("time_input", "time_input")
-    _maybe_wrap("color_picker", "color_picker")
-    _maybe_wrap("camera_input", "camera_input")
-    _maybe_wrap("audio_input", "audio_input")
-    _maybe_wrap("chat_input", "chat_input", has_label=False)
-
-    return key_scope, widget_counters
+    # The set of widgets a Streamlit build exposes never changes at runtime,
+    # so probe for them once and remember the result on the module itself.
+    present = getattr(st, "_mantis_widget_cache", None)
+    if present is None:
+        present = tuple(
+            (attr, has_label) for attr, has_label in _KEYED_WIDGETS if getattr(st, attr, None)
+        )
+        try:
+            st._mantis_widget_cache = present
+        except AttributeError:
+            pass
+    for attr, has_label in present:
+        _maybe_wrap(attr, attr, has_label)
+
+    try:
+        st._mantis_keyhelpers_retval = (key_scope, _counters_for)
+        st._mantis_keyhelpers_installed = True
+    except AttributeError:
+        pass
+    return key_scope, _counters_for()
 
 
 def initialize_session_state(st, config_data: Dict[str, str] = None) -> None:
@@ -1,11 +1,58 @@
 ﻿from __future__ import annotations
 
+import html
 from contextlib import contextmanager
 from collections.abc import Generator
+from functools import lru_cache
 from typing import Iterable, Optional
 
 import streamlit as st
 
+_CTA_TEMPLATE = """
+        <div class="mantis-cta-tile">
+            {icon_html}
+            <div class="mantis-cta-title">{title}</div>
+            <div class="mantis-cta-body">{body}</div>
+            {subtitle_html}
+        </div>
+        """
+
+_HEADER_BAR_TEMPLATE = """
+        <div class="mantis-header">
+            <div>
+                <div style="font-size:24px; font-weight:700;">{title}</div>
+                <div class="mantis-muted" style="margin-top:4px;">{subtitle}</div>
+            </div>
+            <div style="display:flex; gap:12px; align-items:center;">
+                {pill_html}
+                {right_html}
+            </div>
+        </div>
+        """
+
+_EMPTY_STATE_TEMPLATE = """
+        <div class="mantis-card-soft">
+            <div style="font-weight:600;">{title}</div>
+            <div class="mantis-muted" style="margin-top:6px;">{body}</div>
+        </div>
+        """
+
+_STAT_CARD_TEMPLATE = """
+        <div class="mantis-stat-tile">
+            {icon_html}
+            <div class="mantis-stat-label">{label}</div>
+            <div class="mantis-stat-value">{value}</div>
+            {help_html}
+        </div>
+        """
+
+_MESSAGE_TEMPLATE = """
+        <div class="mantis-message mantis-message--{kind}">
+            <span class="mantis-message-icon"></span>
+            <span>{message}</span>
+        </div>
+        """
+
 
 def page_header(
     title: str,
@@ -22,7 +69,8 @@ def page_header(
         pill: Optional status pill text (e.g., "Beta", "New")
         actions: Optional HTML for action buttons in the header
     """
-    pill_html = f"<span class='mantis-pill'>{pill}</span>" if pill else ""
+    title = html.escape(title, quote=True)
+    pill_html = f"<span class='mantis-pill'>{html.escape(pill, quote=True)}</span>" if pill else ""
     actions_html = f"<div style='display:flex; gap:8px; align-items:center;'>{actions}</div>" if actions else ""
     
     st.html(
@@ -34,7 +82,7 @@ def page_header(
                         <h1 class="mantis-page-title" style="margin:0;">{title}</h1>
                         {pill_html}
                     </div>
-                    {f'<div class="mantis-page-subtitle">{subtitle}</div>' if subtitle else ''}
+                    {f'<div class="mantis-page-subtitle">{html.escape(subtitle, quote=True)}</div>' if subtitle else ''}
                 </div>
                 {actions_html}
             </div>
@@ -58,7 +106,8 @@ def section_header(
         tag: Optional tag/badge text
         actions: Optional HTML for action buttons
     """
-    tag_html = f"<span class='mantis-pill'>{tag}</span>" if tag else ""
+    title = html.escape(title, quote=True)
+    tag_html = f"<span class='mantis-pill'>{html.escape(tag, quote=True)}</span>" if tag else ""
     actions_html = actions if actions else ""
     
     st.html(
@@ -69,7 +118,7 @@ def section_header(
                     <h3 class="mantis-section-title">{title}</h3>
                     {tag_html}
                 </div>
-                {f'<div class="mantis-section-caption">{caption}</div>' if caption else ''}
+                {f'<div class="mantis-section-caption">{html.escape(caption, quote=True)}</div>' if caption else ''}
             </div>
             {f'<div>{actions_html}</div>' if actions_html else ''}
         </div>
@@ -111,21 +160,19 @@ def cta_tile(title: str, body: str, *, icon: Optional[str] = None, subtitle: Opt
         icon: Optional standalone icon rendered above the title.
         subtitle: Optional secondary text below *body*.
     """
-    icon_html = f'<div class="mantis-cta-icon">{icon}</div>' if icon else ""
+    icon_html = f'<div class="mantis-cta-icon">{html.escape(icon, quote=True)}</div>' if icon else ""
     subtitle_html = (
-        f'<div class="mantis-cta-subtitle">{subtitle}</div>'
+        f'<div class="mantis-cta-subtitle">{html.escape(subtitle, quote=True)}</div>'
         if subtitle
         else ""
     )
     st.html(
-        f"""
-        <div class="mantis-cta-tile">
-            {icon_html}
-            <div class="mantis-cta-title">{title}</div>
-            <div class="mantis-cta-body">{body}</div>
-            {subtitle_html}
-        </div>
-        """,
+        _CTA_TEMPLATE.format(
+            icon_html=icon_html,
+            title=html.escape(title, quote=True),
+            body=html.escape(body, quote=True),
+            subtitle_html=subtitle_html,
+        ),
     )
 
 
@@ -136,39 +183,42 @@ def header_bar(
     pill: Optional[str] = None,
     right_slot: Optional[str] = None,
 ) -> None:
-    pill_html = f"<span class='mantis-pill'>{pill}</span>" if pill else ""
+    pill_html = f"<span class='mantis-pill'>{html.escape(pill, quote=True)}</span>" if pill else ""
     right_html = f"<div>{right_slot}</div>" if right_slot else ""
     st.html(
-        f"""
-        <div class="mantis-header">
-            <div>
-                <div style="font-size:24px; font-weight:700;">{title}</div>
-                <div class="mantis-muted" style="margin-top:4px;">{subtitle}</div>
-            </div>
-            <div style="display:flex; gap:12px; align-items:center;">
-                {pill_html}
-                {right_html}
-            </div>
-        </div>
-        """,
+        _HEADER_BAR_TEMPLATE.format(
+            title=html.escape(title, quote=True),
+            subtitle=html.escape(subtitle, quote=True),
+            pill_html=pill_html,
+            right_html=right_html,
+        ),
     )
 
 
 def empty_state(title: str, body: str) -> None:
     st.html(
-        f"""
-        <div class="mantis-card-soft">
-            <div style="font-weight:600;">{title}</div>
-            <div class="mantis-muted" style="margin-top:6px;">{body}</div>
-        </div>
-        """,
+        _EMPTY_STATE_TEMPLATE.format(
+            title=html.escape(title, quote=True),
+            body=html.escape(body, quote=True),
+        ),
+    )
+
+
+@lru_cache(maxsize=512)
+def _tags_html(tags: tuple[str, ...]) -> str:
+    """Build the pill row markup for *tags* (cached per tag tuple)."""
+    pills = "".join(
+        f"<span class='mantis-pill'>{html.escape(tag, quote=True)}</span>" for tag in tags if tag
     )
+    if not pills:
+        return ""
+    return f"<div style='display:flex; gap:6px; flex-wrap:wrap;'>{pills}</div>"
 
 
 def render_tag_list(tags: Iterable[str]) -> None:
-    pills = "".join(f"<span class='mantis-pill'>{tag}</span>" for tag in tags if tag)
-    if pills:
-        st.html(f"<div style='display:flex; gap:6px; flex-wrap:wrap;'>{pills}</div>")
+    markup = _tags_html(tuple(tags))
+    if markup:
+        st.html(markup)
 
 
 def stat_card(label: str, value: str, *, icon: Optional[str] = None, help_text: Optional[str] = None) -> None:
@@ -180,18 +230,20 @@ def stat_card(label: str, value: str, *, icon: Optional[str] = None, help_text:
         icon: Optional emoji icon
         help_text: Optional help/description text
     """
-    icon_html = f"<div class='mantis-stat-icon'>{icon}</div>" if icon else ""
-    help_html = f"<div class='mantis-stat-help'>{help_text}</div>" if help_text else ""
+    icon_html = f"<div class='mantis-stat-icon'>{html.escape(icon, quote=True)}</div>" if icon else ""
+    help_html = (
+        f"<div class='mantis-stat-help'>{html.escape(help_text, quote=True)}</div>"
+        if help_text
+        else ""
+    )
     
     st.html(
-        f"""
-        <div class="mantis-stat-tile">
-            {icon_html}
-            <div class="mantis-stat-label">{label}</div>
-            <div class="mantis-stat-value">{value}</div>
-            {help_html}
-        </div>
-        """
+        _STAT_CARD_TEMPLATE.format(
+            icon_html=icon_html,
+            label=html.escape(label, quote=True),
+            value=html.escape(str(value), quote=True),
+            help_html=help_html,
+        )
     )
 
 
@@ -225,24 +277,7 @@ def success_message(message: str) -> None:
     Args:
         message: Success message text
     """
-    st.html(
-        f"""
-        <div style="
-            background: var(--mantis-accent-soft);
-            border: 1px solid var(--mantis-accent-glow);
-            border-radius: var(--mantis-radius-md);
-            padding: 12px 16px;
-            color: var(--mantis-text);
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            margin: 12px 0;
-        ">
-            <span style="font-size:20px;"></span>
-            <span>{message}</span>
-        </div>
-        """
-    )
+    st.html(_MESSAGE_TEMPLATE.format(kind="success", message=message))
 
 
 def error_message(message: str) -> None:
@@ -251,24 +286,7 @@ def error_message(message: str) -> None:
     Args:
         message: Error message text
     """
-    st.html(
-        f"""
-        <div style="
-            background: rgba(239,68,68,0.12);
-            border: 1px solid rgba(239,68,68,0.3);
-            border-radius: var(--mantis-radius-md);
-            padding: 12px 16px;
-            color: var(--mantis-text);
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            margin: 12px 0;
-        ">
-            <span style="font-size:20px;"></span>
-            <span>{message}</span>
-        </div>
-        """
-    )
+    st.html(_MESSAGE_TEMPLATE.format(kind="error", message=message))
 
 
 def info_message(message: str) -> None:
@@ -277,21 +295,4 @@ def info_message(message: str) -> None:
     Args:
         message: Info message text
     """
-    st.html(
-        f"""
-        <div style="
-            background: rgba(56,189,248,0.12);
-            border: 1px solid rgba(56,189,248,0.3);
-            border-radius: var(--mantis-radius-md);
-            padding: 12px 16px;
-            color: var(--mantis-text);
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            margin: 12px 0;
-        ">
-            <span style="font-size:20px;"></span>
-            <span>{message}</span>
-        </div>
-        """
-    )
+    st.html(_MESSAGE_TEMPLATE.format(kind="info", message=message))
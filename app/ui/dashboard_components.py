@@ -1,17 +1,92 @@
 ﻿"""Dashboard-specific UI components for MANTIS Studio enterprise console."""
 from __future__ import annotations
 
+import re
 from collections.abc import Callable
 from typing import Optional
 
 import streamlit as st
 import uuid
 
-SPACING_UNIT = 8
+from app.ui.design_system import Spacing, spacing
 
+SPACING_UNIT = Spacing.BASE
 
-def spacing(multiplier: int) -> str:
-    return f"{SPACING_UNIT * multiplier}px"
+_ESC_RE = re.compile(r"[<>&\"']")
+_ESC_MAP = {"<": "&lt;", ">": "&gt;", "&": "&amp;", '"': "&quot;", "'": "&#39;"}
+
+
+def _esc(value: object) -> str:
+    """HTML-escape *value*, returning plain text unchanged without copying."""
+    text = str(value)
+    if _ESC_RE.search(text) is None:
+        return text
+    return _ESC_RE.sub(lambda match: _ESC_MAP[match.group(0)], text)
+
+
+# Hero action buttons as (label, key slug, button type), in column order.
+_HERO_ACTIONS: tuple[tuple[str, str, str], ...] = (
+    (" New Project", "new_project", "primary"),
+    (" Continue Writing", "continue", "secondary"),
+    (" Analyze Text", "analyze", "secondary"),
+    (" Export", "export", "secondary"),
+)
+
+
+def _noop() -> None:
+    return None
+
+
+# Static markup is built once at import; render helpers only fill in the
+# variable pieces on each rerun.
+_HERO_HTML_PREFIX = """
+        <div class="mantis-enterprise-hero">
+            <div>
+                <h1>MANTIS Control Center</h1>
+                <p>Enterprise narrative intelligence platform for teams, creators, and operators.</p>
+            </div>
+            <div class="mantis-status-pill"><span></span>"""
+_HERO_HTML_SUFFIX = """</div>
+        </div>
+        """
+
+_METRIC_CARD_TMPL = """
+                <div class="mantis-metric-card">
+                    <div class="mantis-metric-label">{}</div>
+                    <div class="mantis-metric-value">{}</div>
+                </div>
+                """
+
+_FEATURE_CELL_TMPL = (
+    '<div><div style="font-weight:600;">{}</div>'
+    '<div class="mantis-muted" style="font-size:0.85rem;margin-top:4px;">{}</div></div>'
+)
+
+_GRID_ROW_TMPL = (
+    "<div style='display:grid;grid-template-columns:repeat({},minmax(0,1fr));"
+    f"gap:{spacing(2)};'>{{}}</div>"
+)
+
+_SECTION_HEADER_TMPL = f"""
+        <div style="margin-top:{spacing(3)};margin-bottom:{spacing(2)};">
+            <h2 style="margin:0;">{{}}</h2>
+            <p style="margin:4px 0 0 0;color:var(--mantis-muted);">{{}}</p>
+        </div>
+        """
+
+_ACTIVITY_ITEM_TMPL = """
+            <div class="mantis-activity-item">
+                <div class="mantis-activity-time">{}</div>
+                <div class="mantis-activity-status">{}</div>
+                <div class="mantis-activity-text">{}</div>
+            </div>
+            """
+
+_DIVIDER_HTML = "<hr style='border:none;border-top:1px solid var(--mantis-border);margin:0;'/>"
+
+_SPACER_CACHE: dict[int, str] = {
+    multiplier: f"<div style='height: {spacing(multiplier)};'></div>" for multiplier in range(17)
+}
 
 
 def render_hero_header(
@@ -23,31 +98,16 @@ def render_hero_header(
     tertiary_action: Optional[Callable[[], None]] = None,
     key_prefix: str = "home",
 ) -> None:
-    st.html(
-        """
-        <div class="mantis-enterprise-hero">
-            <div>
-                <h1>MANTIS Control Center</h1>
-                <p>Enterprise narrative intelligence platform for teams, creators, and operators.</p>
-            </div>
-            <div class="mantis-status-pill"><span></span>"""
-        + status_label
-        + """</div>
-        </div>
-        """
-    )
+    """Render the control-center hero and its action buttons."""
+    st.html(_HERO_HTML_PREFIX + status_label + _HERO_HTML_SUFFIX)
     if status_caption:
         st.caption(status_caption)
 
-    action_cols = st.columns(4)
-    instance = uuid.uuid4().hex
-    actions = [
-        (" New Project", "new_project", primary_action, "primary"),
-        (" Continue Writing", "continue", secondary_action, "secondary"),
-        (" Analyze Text", "analyze", tertiary_action, "secondary"),
-        (" Export", "export", None, "secondary"),
-    ]
-    for idx, (label, slug, callback, btn_type) in enumerate(actions):
+    action_cols = st.columns(len(_HERO_ACTIONS))
+    # Keep button keys stable across reruns so Streamlit reuses the widgets.
+    instance = st.session_state.setdefault(f"{key_prefix}_hero_instance", uuid.uuid4().hex)
+    callbacks = (primary_action or _noop, secondary_action or _noop, tertiary_action or _noop, _noop)
+    for idx, ((label, slug, btn_type), callback) in enumerate(zip(_HERO_ACTIONS, callbacks)):
         with action_cols[idx]:
             if st.button(
                 label,
@@ -55,22 +115,17 @@ def render_hero_header(
                 use_container_width=True,
                 type=btn_type,
             ):
-                if callback:
-                    callback()
+                callback()
+
+
+@st.cache_data(show_spinner=False)
+def _build_metrics_row_html(metrics: tuple[tuple[str, str], ...]) -> str:
+    cards = "".join(_METRIC_CARD_TMPL.format(label, value) for label, value in metrics)
+    return _GRID_ROW_TMPL.format(len(metrics), cards)
 
 
 def render_metrics_row(metrics: list[tuple[str, str]]) -> None:
-    cols = st.columns(len(metrics))
-    for idx, (label, value) in enumerate(metrics):
-        with cols[idx]:
-            st.html(
-                f"""
-                <div class="mantis-metric-card">
-                    <div class="mantis-metric-label">{label}</div>
-                    <div class="mantis-metric-value">{value}</div>
-                </div>
-                """
-            )
+    st.html(_build_metrics_row_html(tuple(metrics)))
 
 
 def render_workspace_hub_section(title: str, content_fn: Callable[[], None]) -> None:
@@ -79,33 +134,56 @@ def render_workspace_hub_section(title: str, content_fn: Callable[[], None]) ->
         content_fn()
 
 
+@st.cache_data(show_spinner=False)
+def _build_feature_grid_html(features: tuple[tuple[str, str], ...]) -> str:
+    cells = "".join(_FEATURE_CELL_TMPL.format(_esc(name), _esc(desc)) for name, desc in features)
+    return _GRID_ROW_TMPL.format(len(features), cells)
+
+
 def render_feature_group(
     group_name: str,
     features: list[tuple[str, str, Callable[[], None]]],
     expanded: bool = False,
     key_prefix: str = "",
 ) -> None:
+    key_base = f"{key_prefix}_{group_name}"
     with st.expander(group_name, expanded=expanded):
-        for idx, (feature_name, feature_desc, action) in enumerate(features):
-            feature_cols = st.columns([3, 1])
-            with feature_cols[0]:
-                st.markdown(f"**{feature_name}**")
-                st.caption(feature_desc)
-            with feature_cols[1]:
-                if st.button("Open", key=f"{key_prefix}_{group_name}_{idx}", use_container_width=True):
+        if not features:
+            return
+        st.html(_build_feature_grid_html(tuple((name, desc) for name, desc, _ in features)))
+        # Buttons sit in equal-width columns under the matching grid cells.
+        # Actions run in the script body, not as on_click callbacks, because
+        # several of them exit early with st.rerun(), which older Streamlit
+        # releases ignore inside callbacks.
+        button_cols = st.columns(len(features))
+        for idx, (feature_name, _, action) in enumerate(features):
+            with button_cols[idx]:
+                if st.button(
+                    "Open",
+                    key=f"{key_base}_{idx}",
+                    help=f"Open {feature_name}",
+                    use_container_width=True,
+                ):
                     with st.spinner(f"Loading {feature_name.lower()}..."):
                         action()
 
 
+@st.cache_data(show_spinner=False)
+def _build_section_header_html(title: str, description: str) -> str:
+    return _SECTION_HEADER_TMPL.format(_esc(title), _esc(description))
+
+
 def render_dashboard_section_header(title: str, description: Optional[str] = None) -> None:
-    st.html(
-        f"""
-        <div style="margin-top:{spacing(3)};margin-bottom:{spacing(2)};">
-            <h2 style="margin:0;">{title}</h2>
-            <p style="margin:4px 0 0 0;color:var(--mantis-muted);">{description or ''}</p>
-        </div>
-        """
+    st.html(_build_section_header_html(title, description or ""))
+
+
+@st.cache_data(show_spinner=False)
+def _build_activity_feed_html(events: tuple[tuple[str, str, str], ...]) -> str:
+    items = "".join(
+        _ACTIVITY_ITEM_TMPL.format(_esc(ts), _esc(status), _esc(message))
+        for ts, status, message in events
     )
+    return f'<div class="mantis-activity-feed">{items}</div>'
 
 
 def render_activity_feed(events: list[tuple[str, str, str]]) -> None:
@@ -113,24 +191,20 @@ def render_activity_feed(events: list[tuple[str, str, str]]) -> None:
     if not events:
         st.caption("No recent activity yet.")
         return
-    for ts, status, message in events:
-        st.html(
-            f"""
-            <div class="mantis-activity-item">
-                <div class="mantis-activity-time">{ts}</div>
-                <div class="mantis-activity-status">{status}</div>
-                <div class="mantis-activity-text">{message}</div>
-            </div>
-            """
-        )
+    st.html(_build_activity_feed_html(tuple(events)))
+
+
+def _spacer_html(multiplier: int) -> str:
+    spacer = _SPACER_CACHE.get(multiplier)
+    if spacer is None:
+        spacer = f"<div style='height: {spacing(multiplier)};'></div>"
+    return spacer
 
 
 def add_vertical_space(multiplier: int = 2) -> None:
-    st.html(f"<div style='height: {spacing(multiplier)};'></div>")
+    st.html(_spacer_html(multiplier))
 
 
 def add_divider_with_spacing(top: int = 3, bottom: int = 3) -> None:
-    add_vertical_space(top)
-    st.divider()
-    add_vertical_space(bottom)
+    st.html(_spacer_html(top) + _DIVIDER_HTML + _spacer_html(bottom))
 
@@ -14,14 +14,17 @@ All UI components should reference this design system for consistency.
 """
 
 from __future__ import annotations
-from typing import Dict, Literal
-from dataclasses import dataclass
+import sys
+from types import MappingProxyType
+from typing import Final, Literal, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 # =============================================================================
 # COLOR SYSTEM
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColorPalette:
     """Comprehensive color palette for Mantis Studio"""
     # Brand colors
@@ -159,60 +162,78 @@ LIGHT_PALETTE = ColorPalette(
 # TYPOGRAPHY SYSTEM
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class TypeToken:
+    """A single typography step with its CSS declarations prebuilt"""
+    size: str
+    weight: str
+    line_height: str
+    letter_spacing: str
+    css: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "css",
+            f"font-size:{self.size};font-weight:{self.weight};"
+            f"line-height:{self.line_height};letter-spacing:{self.letter_spacing}",
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class TypographyScale:
     """Typography scale with consistent sizing and weights"""
     # Display
-    display_xl: Dict[str, str]
-    display_lg: Dict[str, str]
-    display_md: Dict[str, str]
+    display_xl: TypeToken
+    display_lg: TypeToken
+    display_md: TypeToken
     
     # Headings
-    h1: Dict[str, str]
-    h2: Dict[str, str]
-    h3: Dict[str, str]
-    h4: Dict[str, str]
-    h5: Dict[str, str]
-    h6: Dict[str, str]
+    h1: TypeToken
+    h2: TypeToken
+    h3: TypeToken
+    h4: TypeToken
+    h5: TypeToken
+    h6: TypeToken
     
     # Body
-    body_lg: Dict[str, str]
-    body: Dict[str, str]
-    body_sm: Dict[str, str]
+    body_lg: TypeToken
+    body: TypeToken
+    body_sm: TypeToken
     
     # Captions
-    caption: Dict[str, str]
-    caption_sm: Dict[str, str]
+    caption: TypeToken
+    caption_sm: TypeToken
     
     # Overline/Label
-    overline: Dict[str, str]
+    overline: TypeToken
 
 
 TYPOGRAPHY = TypographyScale(
     # Display (hero sections)
-    display_xl={"size": "56px", "weight": "700", "line_height": "1.1", "letter_spacing": "-0.03em"},
-    display_lg={"size": "48px", "weight": "700", "line_height": "1.15", "letter_spacing": "-0.03em"},
-    display_md={"size": "40px", "weight": "700", "line_height": "1.2", "letter_spacing": "-0.02em"},
+    display_xl=TypeToken("56px", "700", "1.1", "-0.03em"),
+    display_lg=TypeToken("48px", "700", "1.15", "-0.03em"),
+    display_md=TypeToken("40px", "700", "1.2", "-0.02em"),
     
     # Headings
-    h1={"size": "34px", "weight": "700", "line_height": "1.25", "letter_spacing": "-0.02em"},
-    h2={"size": "28px", "weight": "600", "line_height": "1.3", "letter_spacing": "-0.015em"},
-    h3={"size": "24px", "weight": "600", "line_height": "1.35", "letter_spacing": "-0.01em"},
-    h4={"size": "20px", "weight": "600", "line_height": "1.4", "letter_spacing": "-0.01em"},
-    h5={"size": "18px", "weight": "600", "line_height": "1.45", "letter_spacing": "0"},
-    h6={"size": "16px", "weight": "600", "line_height": "1.5", "letter_spacing": "0"},
+    h1=TypeToken("34px", "700", "1.25", "-0.02em"),
+    h2=TypeToken("28px", "600", "1.3", "-0.015em"),
+    h3=TypeToken("24px", "600", "1.35", "-0.01em"),
+    h4=TypeToken("20px", "600", "1.4", "-0.01em"),
+    h5=TypeToken("18px", "600", "1.45", "0"),
+    h6=TypeToken("16px", "600", "1.5", "0"),
     
     # Body
-    body_lg={"size": "17px", "weight": "400", "line_height": "1.65", "letter_spacing": "0"},
-    body={"size": "15px", "weight": "400", "line_height": "1.6", "letter_spacing": "0"},
-    body_sm={"size": "14px", "weight": "400", "line_height": "1.55", "letter_spacing": "0"},
+    body_lg=TypeToken("17px", "400", "1.65", "0"),
+    body=TypeToken("15px", "400", "1.6", "0"),
+    body_sm=TypeToken("14px", "400", "1.55", "0"),
     
     # Captions
-    caption={"size": "13px", "weight": "400", "line_height": "1.5", "letter_spacing": "0"},
-    caption_sm={"size": "12px", "weight": "400", "line_height": "1.4", "letter_spacing": "0"},
+    caption=TypeToken("13px", "400", "1.5", "0"),
+    caption_sm=TypeToken("12px", "400", "1.4", "0"),
     
     # Overline/Label (uppercase labels)
-    overline={"size": "11px", "weight": "600", "line_height": "1.3", "letter_spacing": "0.08em"},
+    overline=TypeToken("11px", "600", "1.3", "0.08em"),
 )
 
 
@@ -220,8 +241,18 @@ TYPOGRAPHY = TypographyScale(
 # SPACING SYSTEM (8px grid)
 # =============================================================================
 
+def _intern_constants(cls: type) -> type:
+    """Intern the upper-case string constants of a token namespace class"""
+    for name, value in list(vars(cls).items()):
+        if name.isupper() and isinstance(value, str):
+            setattr(cls, name, sys.intern(value))
+    return cls
+
+
+@_intern_constants
 class Spacing:
     """8px-based spacing system for consistent layouts"""
+    __slots__ = ()
     # Base unit
     BASE = 8
     
@@ -246,17 +277,31 @@ class Spacing:
     INPUT_PADDING = "10px 14px"
     
     @staticmethod
+    @lru_cache(maxsize=128)
     def scale(multiplier: float) -> str:
         """Generate spacing value based on multiplier of base unit"""
         return f"{int(Spacing.BASE * multiplier)}px"
 
 
+# Layouts only ask for small whole multiples, so look those up directly.
+_SPACING_PX: tuple[str, ...] = tuple(f"{Spacing.BASE * i}px" for i in range(65))
+
+
+def spacing(multiplier: int) -> str:
+    """Spacing value for a whole multiple of the base unit"""
+    if 0 <= multiplier < len(_SPACING_PX):
+        return _SPACING_PX[multiplier]
+    return f"{Spacing.BASE * multiplier}px"
+
+
 # =============================================================================
 # BORDER RADIUS SYSTEM
 # =============================================================================
 
+@_intern_constants
 class BorderRadius:
     """Consistent border radius values"""
+    __slots__ = ()
     NONE = "0"
     SM = "8px"
     MD = "12px"
@@ -276,64 +321,74 @@ class BorderRadius:
 # BUTTON STYLES
 # =============================================================================
 
+_PRIMARY_BUTTON: Mapping[str, str] = MappingProxyType({
+    "background": "var(--mantis-primary-bg)",
+    "color": "#ffffff",
+    "border": "1px solid var(--mantis-primary-border)",
+    "border_radius": BorderRadius.BUTTON,
+    "padding": "10px 20px",
+    "font_weight": "600",
+    "font_size": "14px",
+    "hover_border": "var(--mantis-primary-hover-border)",
+    "box_shadow": "var(--mantis-shadow-button)",
+})
+
+_SECONDARY_BUTTON: Mapping[str, str] = MappingProxyType({
+    "background": "var(--mantis-button-bg)",
+    "color": "var(--mantis-text)",
+    "border": "1px solid var(--mantis-button-border)",
+    "border_radius": BorderRadius.BUTTON,
+    "padding": "10px 20px",
+    "font_weight": "600",
+    "font_size": "14px",
+    "hover_border": "var(--mantis-button-hover-border)",
+    "box_shadow": "none",
+})
+
+_DESTRUCTIVE_BUTTON: Mapping[str, str] = MappingProxyType({
+    "background": "linear-gradient(135deg, #dc2626, #991b1b)",
+    "color": "#ffffff",
+    "border": "1px solid rgba(220,38,38,0.5)",
+    "border_radius": BorderRadius.BUTTON,
+    "padding": "10px 20px",
+    "font_weight": "600",
+    "font_size": "14px",
+    "hover_border": "#ef4444",
+    "box_shadow": "0 4px 12px rgba(220,38,38,0.25)",
+})
+
+_GHOST_BUTTON: Mapping[str, str] = MappingProxyType({
+    "background": "transparent",
+    "color": "var(--mantis-text)",
+    "border": "1px solid transparent",
+    "border_radius": BorderRadius.BUTTON,
+    "padding": "10px 20px",
+    "font_weight": "600",
+    "font_size": "14px",
+    "hover_border": "var(--mantis-border)",
+    "box_shadow": "none",
+})
+
+
 class ButtonStyles:
     """Standardized button style configurations"""
+    __slots__ = ()
     
     @staticmethod
-    def primary() -> Dict[str, str]:
-        return {
-            "background": "var(--mantis-primary-bg)",
-            "color": "#ffffff",
-            "border": "1px solid var(--mantis-primary-border)",
-            "border_radius": BorderRadius.BUTTON,
-            "padding": "10px 20px",
-            "font_weight": "600",
-            "font_size": "14px",
-            "hover_border": "var(--mantis-primary-hover-border)",
-            "box_shadow": "var(--mantis-shadow-button)",
-        }
+    def primary() -> Mapping[str, str]:
+        return _PRIMARY_BUTTON
     
     @staticmethod
-    def secondary() -> Dict[str, str]:
-        return {
-            "background": "var(--mantis-button-bg)",
-            "color": "var(--mantis-text)",
-            "border": "1px solid var(--mantis-button-border)",
-            "border_radius": BorderRadius.BUTTON,
-            "padding": "10px 20px",
-            "font_weight": "600",
-            "font_size": "14px",
-            "hover_border": "var(--mantis-button-hover-border)",
-            "box_shadow": "none",
-        }
+    def secondary() -> Mapping[str, str]:
+        return _SECONDARY_BUTTON
     
     @staticmethod
-    def destructive() -> Dict[str, str]:
-        return {
-            "background": "linear-gradient(135deg, #dc2626, #991b1b)",
-            "color": "#ffffff",
-            "border": "1px solid rgba(220,38,38,0.5)",
-            "border_radius": BorderRadius.BUTTON,
-            "padding": "10px 20px",
-            "font_weight": "600",
-            "font_size": "14px",
-            "hover_border": "#ef4444",
-            "box_shadow": "0 4px 12px rgba(220,38,38,0.25)",
-        }
+    def destructive() -> Mapping[str, str]:
+        return _DESTRUCTIVE_BUTTON
     
     @staticmethod
-    def ghost() -> Dict[str, str]:
-        return {
-            "background": "transparent",
-            "color": "var(--mantis-text)",
-            "border": "1px solid transparent",
-            "border_radius": BorderRadius.BUTTON,
-            "padding": "10px 20px",
-            "font_weight": "600",
-            "font_size": "14px",
-            "hover_border": "var(--mantis-border)",
-            "box_shadow": "none",
-        }
+    def ghost() -> Mapping[str, str]:
+        return _GHOST_BUTTON
 
 
 # =============================================================================
@@ -342,6 +397,7 @@ class ButtonStyles:
 
 class Layout:
     """Layout constants and breakpoints"""
+    __slots__ = ()
     # Container widths
     CONTAINER_SM = "640px"
     CONTAINER_MD = "768px"
@@ -365,61 +421,101 @@ class Layout:
 # COMPONENT PATTERNS
 # =============================================================================
 
+_CARD_ELEVATED: Mapping[str, str] = MappingProxyType({
+    "background": "var(--mantis-surface)",
+    "border": "1px solid var(--mantis-border)",
+    "border_radius": BorderRadius.CARD,
+    "padding": Spacing.CARD_PADDING,
+    "box_shadow": "var(--mantis-shadow-md)",
+})
+
+_CARD_FLAT: Mapping[str, str] = MappingProxyType({
+    "background": "var(--mantis-surface-alt)",
+    "border": "1px solid var(--mantis-border-light)",
+    "border_radius": BorderRadius.CARD,
+    "padding": Spacing.CARD_PADDING,
+    "box_shadow": "none",
+})
+
+_PILL: Mapping[str, str] = MappingProxyType({
+    "display": "inline-flex",
+    "align_items": "center",
+    "gap": "6px",
+    "padding": "6px 12px",
+    "border_radius": BorderRadius.PILL,
+    "border": "1px solid var(--mantis-accent-glow)",
+    "background": "var(--mantis-accent-soft)",
+    "font_size": TYPOGRAPHY.caption_sm.size,
+    "font_weight": "500",
+    "color": "var(--mantis-text)",
+})
+
+
 class Components:
     """Reusable component style patterns"""
+    __slots__ = ()
     
     @staticmethod
-    def card_elevated() -> Dict[str, str]:
-        return {
-            "background": "var(--mantis-surface)",
-            "border": "1px solid var(--mantis-border)",
-            "border_radius": BorderRadius.CARD,
-            "padding": Spacing.CARD_PADDING,
-            "box_shadow": "var(--mantis-shadow-md)",
-        }
+    def card_elevated() -> Mapping[str, str]:
+        return _CARD_ELEVATED
     
     @staticmethod
-    def card_flat() -> Dict[str, str]:
-        return {
-            "background": "var(--mantis-surface-alt)",
-            "border": "1px solid var(--mantis-border-light)",
-            "border_radius": BorderRadius.CARD,
-            "padding": Spacing.CARD_PADDING,
-            "box_shadow": "none",
-        }
+    def card_flat() -> Mapping[str, str]:
+        return _CARD_FLAT
     
     @staticmethod
-    def pill() -> Dict[str, str]:
-        return {
-            "display": "inline-flex",
-            "align_items": "center",
-            "gap": "6px",
-            "padding": "6px 12px",
-            "border_radius": BorderRadius.PILL,
-            "border": "1px solid var(--mantis-accent-glow)",
-            "background": "var(--mantis-accent-soft)",
-            "font_size": TYPOGRAPHY.caption_sm["size"],
-            "font_weight": "500",
-            "color": "var(--mantis-text)",
-        }
+    def pill() -> Mapping[str, str]:
+        return _PILL
+
+
+def _css_block(selector: str, style: Mapping[str, str]) -> str:
+    """Render a style map as a single CSS rule (hover-only keys are skipped)"""
+    body = ";".join(
+        f"{key.replace('_', '-')}:{value}"
+        for key, value in style.items()
+        if not key.startswith("hover_")
+    )
+    return f"{selector}{{{body}}}"
+
+
+def _build_component_css() -> str:
+    """Build the card and pill rules from the component style maps"""
+    return "\n".join((
+        _css_block(".mantis-card", {**_CARD_ELEVATED, "margin_bottom": Spacing.MD}),
+        _css_block(".mantis-card-flat", _CARD_FLAT),
+        _css_block(".mantis-pill", _PILL),
+    ))
+
+
+# The component maps only reference CSS variables, so one stylesheet serves
+# both themes and is built once at import.
+COMPONENT_CSS: str = _build_component_css()
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+_PALETTES: Final[Mapping[str, ColorPalette]] = MappingProxyType({
+    "Dark": DARK_PALETTE,
+    "Light": LIGHT_PALETTE,
+})
+
+
 def get_palette(theme: Literal["Dark", "Light"] = "Dark") -> ColorPalette:
     """Get color palette for specified theme"""
-    return DARK_PALETTE if theme == "Dark" else LIGHT_PALETTE
+    # Anything other than "Dark" has always resolved to the light palette.
+    return _PALETTES.get(theme, LIGHT_PALETTE)
 
 
+@lru_cache(maxsize=None)
 def get_css_variable(name: str) -> str:
     """Generate CSS variable reference"""
-    return f"var(--mantis-{name})"
+    return sys.intern(f"var(--mantis-{name})")
 
 
-def generate_spacing_css() -> str:
-    """Generate CSS for spacing utilities"""
+def _build_spacing_css() -> str:
+    """Build CSS for spacing utilities"""
     css_lines = []
     for i in range(0, 13):  # 0 to 96px (12 * 8)
         value = Spacing.scale(i)
@@ -434,6 +530,15 @@ def generate_spacing_css() -> str:
     return "\n".join(css_lines)
 
 
+# The spacing utilities depend only on constants, so build them once.
+SPACING_CSS: str = _build_spacing_css()
+
+
+def generate_spacing_css() -> str:
+    """Generate CSS for spacing utilities"""
+    return SPACING_CSS
+
+
 # =============================================================================
 # EXPORTS
 # =============================================================================
@@ -442,14 +547,18 @@ __all__ = [
     "ColorPalette",
     "DARK_PALETTE",
     "LIGHT_PALETTE",
+    "TypeToken",
     "TypographyScale",
     "TYPOGRAPHY",
     "Spacing",
+    "spacing",
     "BorderRadius",
     "ButtonStyles",
     "Layout",
     "Components",
+    "COMPONENT_CSS",
     "get_palette",
     "get_css_variable",
+    "SPACING_CSS",
     "generate_spacing_css",
 ]
@@ -6,6 +6,10 @@ including CSS variable generation, theme switching, and component styling.
 """
 
 from __future__ import annotations
+import logging
+from dataclasses import fields
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Literal
 import streamlit as st
 
@@ -14,124 +18,170 @@ from app.ui.design_system import (
     TYPOGRAPHY,
     Spacing,
     BorderRadius,
-    Components,
+    COMPONENT_CSS,
     generate_spacing_css,
 )
-
-
+from app.ui.navigation import NAVIGATION_CSS
+
+logger = logging.getLogger("MANTIS")
+
+
+# Theme-specific values that are not part of the palette, keyed by theme.
+_THEME_STATIC: Dict[str, Dict[str, str]] = {
+    "Dark": {
+        "button_bg": "linear-gradient(180deg, #0f1a15, #0b1411)",
+        "button_border": "#163f2a",
+        "primary_bg": "linear-gradient(135deg, #15803d, #22c55e)",
+        "input_bg": "#0b1216",
+        "input_border": "#166534",
+        "sidebar_bg": "linear-gradient(180deg, #020617, #07150f)",
+        "sidebar_border": "#123123",
+        "sidebar_title": "#7dd3a7",
+        "sidebar_brand_bg": "linear-gradient(180deg, rgba(6,18,14,0.85), rgba(4,10,8,0.95))",
+        "header_gradient": "linear-gradient(135deg, #0b1216, #0f1a15)",
+        "divider": "#143023",
+        "expander_border": "#1f3b2d",
+        "bg_glow": "radial-gradient(circle at 20% 20%, rgba(34,197,94,0.18), transparent 45%), radial-gradient(circle at 80% 0%, rgba(74,222,128,0.18), transparent 40%)",
+    },
+    "Light": {
+        "button_bg": "linear-gradient(180deg, #fafbfa, #f0f5f2)",
+        "button_border": "#6a8a7b",
+        "primary_bg": "linear-gradient(135deg, #16a34a, #15803d)",
+        "input_bg": "#fafbfa",
+        "input_border": "#6a8a7b",
+        "sidebar_bg": "linear-gradient(180deg, #eef1ef, #e4e9e6)",
+        "sidebar_border": "#708378",
+        "sidebar_title": "#15803d",
+        "sidebar_brand_bg": "linear-gradient(180deg, rgba(250,251,250,0.95), rgba(243,247,245,0.95))",
+        "header_gradient": "linear-gradient(135deg, #e2f3e8, #d0eddb)",
+        "divider": "#7a8e82",
+        "expander_border": "#708a7e",
+        "bg_glow": "radial-gradient(circle at 20% 20%, rgba(34,197,94,0.08), transparent 45%), radial-gradient(circle at 80% 0%, rgba(74,222,128,0.06), transparent 40%)",
+    },
+}
+
+
+# Spacing and radius values shared by both themes.
+_LAYOUT_TOKENS: Dict[str, str] = {
+    "spacing_xs": Spacing.XS,
+    "spacing_sm": Spacing.SM,
+    "spacing_md": Spacing.MD,
+    "spacing_lg": Spacing.LG,
+    "spacing_xl": Spacing.XL,
+    "spacing_xxl": Spacing.XXL,
+    "radius_sm": BorderRadius.SM,
+    "radius_md": BorderRadius.MD,
+    "radius_lg": BorderRadius.LG,
+    "radius_xl": BorderRadius.XL,
+    "radius_full": BorderRadius.FULL,
+}
+
+# Parsed once at import; each theme is rendered with a single format_map.
+_THEME_VARS_TEMPLATE = "\n".join((
+    ":root {{",
+    "/* === Brand Colors === */",
+    "--mantis-primary: {primary};",
+    "--mantis-primary-hover: {primary_hover};",
+    "--mantis-primary-light: {primary_light};",
+    "--mantis-primary-dark: {primary_dark};",
+    "/* === Secondary/Accent === */",
+    "--mantis-secondary: {secondary};",
+    "--mantis-accent: {accent};",
+    "--mantis-accent-soft: {accent_soft};",
+    "--mantis-accent-glow: {accent_glow};",
+    "/* === Backgrounds === */",
+    "--mantis-bg: {bg};",
+    "--mantis-bg-primary: {bg};",
+    "--mantis-bg-secondary: {bg_surface_raised};",
+    "--mantis-surface: {bg_surface};",
+    "--mantis-surface-raised: {bg_surface_raised};",
+    "--mantis-surface-sunken: {bg_surface_sunken};",
+    "--mantis-surface-alt: {bg_surface};",
+    "--mantis-card-bg: {bg_surface_raised};",
+    "/* === Text === */",
+    "--mantis-text: {text};",
+    "--mantis-text-secondary: {text_secondary};",
+    "--mantis-text-muted: {text_muted};",
+    "--mantis-text-inverse: {text_inverse};",
+    "--mantis-muted: {text_muted};",
+    "/* === Borders === */",
+    "--mantis-border: {border};",
+    "--mantis-border-light: {border_light};",
+    "--mantis-border-strong: {border_strong};",
+    "--mantis-card-border: {border};",
+    "/* === State Colors === */",
+    "--mantis-success: {success};",
+    "--mantis-warning: {warning};",
+    "--mantis-error: {error};",
+    "--mantis-danger: {error};",
+    "--mantis-info: {info};",
+    "--mantis-accent-teal: {secondary};",
+    "/* === Shadows === */",
+    "--mantis-shadow-sm: {shadow_sm};",
+    "--mantis-shadow-md: {shadow_md};",
+    "--mantis-shadow-lg: {shadow_lg};",
+    "--mantis-shadow-xl: {shadow_xl};",
+    "--mantis-shadow-strong: {shadow_lg};",
+    "--mantis-shadow-button: {shadow_md};",
+    "/* === Button Colors === */",
+    "--mantis-button-bg: {button_bg};",
+    "--mantis-button-border: {button_border};",
+    "--mantis-button-hover-border: {primary};",
+    "--mantis-primary-bg: {primary_bg};",
+    "--mantis-primary-border: {accent_glow};",
+    "--mantis-primary-hover-border: {primary_hover};",
+    "/* === Input Colors === */",
+    "--mantis-input-bg: {input_bg};",
+    "--mantis-input-border: {input_border};",
+    "/* === Sidebar === */",
+    "--mantis-sidebar-bg: {sidebar_bg};",
+    "--mantis-sidebar-border: {sidebar_border};",
+    "--mantis-sidebar-title: {sidebar_title};",
+    "--mantis-sidebar-brand-bg: {sidebar_brand_bg};",
+    "--mantis-sidebar-brand-border: {accent_soft};",
+    "--mantis-sidebar-logo-bg: {accent_soft};",
+    "/* === Header === */",
+    "--mantis-header-gradient: {header_gradient};",
+    "--mantis-header-logo-bg: {accent_soft};",
+    "--mantis-header-sub: {text_secondary};",
+    "--mantis-top-offset: 0rem;",
+    "/* === Dividers === */",
+    "--mantis-divider: {divider};",
+    "--mantis-expander-border: {expander_border};",
+    "/* === Background Effects === */",
+    "--mantis-bg-glow: {bg_glow};",
+    "/* === Streamlit Core Theme Bridge === */",
+    "--background-color: {bg};",
+    "--secondary-background-color: {bg_surface};",
+    "--text-color: {text};",
+    "/* === Spacing === */",
+    "--mantis-spacing-xs: {spacing_xs};",
+    "--mantis-spacing-sm: {spacing_sm};",
+    "--mantis-spacing-md: {spacing_md};",
+    "--mantis-spacing-lg: {spacing_lg};",
+    "--mantis-spacing-xl: {spacing_xl};",
+    "--mantis-spacing-xxl: {spacing_xxl};",
+    "/* === Border Radius === */",
+    "--mantis-radius-sm: {radius_sm};",
+    "--mantis-radius-md: {radius_md};",
+    "--mantis-radius-lg: {radius_lg};",
+    "--mantis-radius-xl: {radius_xl};",
+    "--mantis-radius-full: {radius_full};",
+    "}}",
+))
+
+
+@lru_cache(maxsize=None)
 def generate_theme_css_variables(theme: Literal["Dark", "Light"] = "Dark") -> str:
     """Generate comprehensive CSS variables from design system"""
     palette = get_palette(theme)
-    
-    return f"""
-    :root {{
-        /* === Brand Colors === */
-        --mantis-primary: {palette.primary};
-        --mantis-primary-hover: {palette.primary_hover};
-        --mantis-primary-light: {palette.primary_light};
-        --mantis-primary-dark: {palette.primary_dark};
-        
-        /* === Secondary/Accent === */
-        --mantis-secondary: {palette.secondary};
-        --mantis-accent: {palette.accent};
-        --mantis-accent-soft: {palette.accent_soft};
-        --mantis-accent-glow: {palette.accent_glow};
-        
-        /* === Backgrounds === */
-        --mantis-bg: {palette.bg};
-        --mantis-bg-primary: {palette.bg};
-        --mantis-bg-secondary: {palette.bg_surface_raised};
-        --mantis-surface: {palette.bg_surface};
-        --mantis-surface-raised: {palette.bg_surface_raised};
-        --mantis-surface-sunken: {palette.bg_surface_sunken};
-        --mantis-surface-alt: {palette.bg_surface};
-        --mantis-card-bg: {palette.bg_surface_raised};
-        
-        /* === Text === */
-        --mantis-text: {palette.text};
-        --mantis-text-secondary: {palette.text_secondary};
-        --mantis-text-muted: {palette.text_muted};
-        --mantis-text-inverse: {palette.text_inverse};
-        --mantis-muted: {palette.text_muted};
-        
-        /* === Borders === */
-        --mantis-border: {palette.border};
-        --mantis-border-light: {palette.border_light};
-        --mantis-border-strong: {palette.border_strong};
-        --mantis-card-border: {palette.border};
-        
-        /* === State Colors === */
-        --mantis-success: {palette.success};
-        --mantis-warning: {palette.warning};
-        --mantis-error: {palette.error};
-        --mantis-danger: {palette.error};
-        --mantis-info: {palette.info};
-        --mantis-accent-teal: {palette.secondary};
-        
-        /* === Shadows === */
-        --mantis-shadow-sm: {palette.shadow_sm};
-        --mantis-shadow-md: {palette.shadow_md};
-        --mantis-shadow-lg: {palette.shadow_lg};
-        --mantis-shadow-xl: {palette.shadow_xl};
-        --mantis-shadow-strong: {palette.shadow_lg};
-        --mantis-shadow-button: {palette.shadow_md};
-        
-        /* === Button Colors === */
-        --mantis-button-bg: {"linear-gradient(180deg, #0f1a15, #0b1411)" if theme == "Dark" else "linear-gradient(180deg, #fafbfa, #f0f5f2)"};
-        --mantis-button-border: {"#163f2a" if theme == "Dark" else "#6a8a7b"};
-        --mantis-button-hover-border: {palette.primary};
-        --mantis-primary-bg: {"linear-gradient(135deg, #15803d, #22c55e)" if theme == "Dark" else "linear-gradient(135deg, #16a34a, #15803d)"};
-        --mantis-primary-border: {palette.accent_glow};
-        --mantis-primary-hover-border: {palette.primary_hover};
-        
-        /* === Input Colors === */
-        --mantis-input-bg: {"#0b1216" if theme == "Dark" else "#fafbfa"};
-        --mantis-input-border: {"#166534" if theme == "Dark" else "#6a8a7b"};
-        
-        /* === Sidebar === */
-        --mantis-sidebar-bg: {"linear-gradient(180deg, #020617, #07150f)" if theme == "Dark" else "linear-gradient(180deg, #eef1ef, #e4e9e6)"};
-        --mantis-sidebar-border: {"#123123" if theme == "Dark" else "#708378"};
-        --mantis-sidebar-title: {"#7dd3a7" if theme == "Dark" else "#15803d"};
-        --mantis-sidebar-brand-bg: {"linear-gradient(180deg, rgba(6,18,14,0.85), rgba(4,10,8,0.95))" if theme == "Dark" else "linear-gradient(180deg, rgba(250,251,250,0.95), rgba(243,247,245,0.95))"};
-        --mantis-sidebar-brand-border: {palette.accent_soft};
-        --mantis-sidebar-logo-bg: {palette.accent_soft};
-        
-        /* === Header === */
-        --mantis-header-gradient: {"linear-gradient(135deg, #0b1216, #0f1a15)" if theme == "Dark" else "linear-gradient(135deg, #e2f3e8, #d0eddb)"};
-        --mantis-header-logo-bg: {palette.accent_soft};
-        --mantis-header-sub: {palette.text_secondary};
-        --mantis-top-offset: 0rem;
-        
-        /* === Dividers === */
-        --mantis-divider: {"#143023" if theme == "Dark" else "#7a8e82"};
-        --mantis-expander-border: {"#1f3b2d" if theme == "Dark" else "#708a7e"};
-        
-        /* === Background Effects === */
-        --mantis-bg-glow: {"radial-gradient(circle at 20% 20%, rgba(34,197,94,0.18), transparent 45%), radial-gradient(circle at 80% 0%, rgba(74,222,128,0.18), transparent 40%)" if theme == "Dark" else "radial-gradient(circle at 20% 20%, rgba(34,197,94,0.08), transparent 45%), radial-gradient(circle at 80% 0%, rgba(74,222,128,0.06), transparent 40%)"};
-
-        /* === Streamlit Core Theme Bridge === */
-        --background-color: {palette.bg};
-        --secondary-background-color: {palette.bg_surface};
-        --text-color: {palette.text};
-        
-        /* === Spacing === */
-        --mantis-spacing-xs: {Spacing.XS};
-        --mantis-spacing-sm: {Spacing.SM};
-        --mantis-spacing-md: {Spacing.MD};
-        --mantis-spacing-lg: {Spacing.LG};
-        --mantis-spacing-xl: {Spacing.XL};
-        --mantis-spacing-xxl: {Spacing.XXL};
-        
-        /* === Border Radius === */
-        --mantis-radius-sm: {BorderRadius.SM};
-        --mantis-radius-md: {BorderRadius.MD};
-        --mantis-radius-lg: {BorderRadius.LG};
-        --mantis-radius-xl: {BorderRadius.XL};
-        --mantis-radius-full: {BorderRadius.FULL};
-    }}
-    """
+    tokens = {item.name: getattr(palette, item.name) for item in fields(palette)}
+    tokens.update(_THEME_STATIC["Dark" if theme == "Dark" else "Light"])
+    tokens.update(_LAYOUT_TOKENS)
+    return _THEME_VARS_TEMPLATE.format_map(tokens)
 
 
+@lru_cache(maxsize=None)
 def generate_typography_css() -> str:
     """Generate typography CSS from design system"""
     return f"""
@@ -140,86 +190,65 @@ def generate_typography_css() -> str:
     
     body, .stApp, .stMarkdown {{
         font-family: 'Inter', sans-serif;
-        font-size: {TYPOGRAPHY.body["size"]};
-        line-height: {TYPOGRAPHY.body["line_height"]};
-        letter-spacing: {TYPOGRAPHY.body["letter_spacing"]};
+        font-size: {TYPOGRAPHY.body.size};
+        line-height: {TYPOGRAPHY.body.line_height};
+        letter-spacing: {TYPOGRAPHY.body.letter_spacing};
     }}
     
     h1, .mantis-h1 {{
         font-family: 'Space Grotesk', sans-serif;
-        font-size: {TYPOGRAPHY.h1["size"]};
-        font-weight: {TYPOGRAPHY.h1["weight"]};
-        line-height: {TYPOGRAPHY.h1["line_height"]};
-        letter-spacing: {TYPOGRAPHY.h1["letter_spacing"]};
+        {TYPOGRAPHY.h1.css};
         color: var(--mantis-text);
         margin-bottom: {Spacing.MD};
     }}
     
     h2, .mantis-h2 {{
         font-family: 'Space Grotesk', sans-serif;
-        font-size: {TYPOGRAPHY.h2["size"]};
-        font-weight: {TYPOGRAPHY.h2["weight"]};
-        line-height: {TYPOGRAPHY.h2["line_height"]};
-        letter-spacing: {TYPOGRAPHY.h2["letter_spacing"]};
+        {TYPOGRAPHY.h2.css};
         color: var(--mantis-text);
         margin-bottom: {Spacing.SM};
     }}
     
     h3, .mantis-h3 {{
         font-family: 'Space Grotesk', sans-serif;
-        font-size: {TYPOGRAPHY.h3["size"]};
-        font-weight: {TYPOGRAPHY.h3["weight"]};
-        line-height: {TYPOGRAPHY.h3["line_height"]};
-        letter-spacing: {TYPOGRAPHY.h3["letter_spacing"]};
+        {TYPOGRAPHY.h3.css};
         color: var(--mantis-text);
         margin-bottom: {Spacing.SM};
     }}
     
     h4, .mantis-h4 {{
-        font-size: {TYPOGRAPHY.h4["size"]};
-        font-weight: {TYPOGRAPHY.h4["weight"]};
-        line-height: {TYPOGRAPHY.h4["line_height"]};
-        letter-spacing: {TYPOGRAPHY.h4["letter_spacing"]};
+        {TYPOGRAPHY.h4.css};
         color: var(--mantis-text);
     }}
     
     h5, .mantis-h5 {{
-        font-size: {TYPOGRAPHY.h5["size"]};
-        font-weight: {TYPOGRAPHY.h5["weight"]};
-        line-height: {TYPOGRAPHY.h5["line_height"]};
-        letter-spacing: {TYPOGRAPHY.h5["letter_spacing"]};
+        {TYPOGRAPHY.h5.css};
         color: var(--mantis-text);
     }}
     
     h6, .mantis-h6 {{
-        font-size: {TYPOGRAPHY.h6["size"]};
-        font-weight: {TYPOGRAPHY.h6["weight"]};
-        line-height: {TYPOGRAPHY.h6["line_height"]};
-        letter-spacing: {TYPOGRAPHY.h6["letter_spacing"]};
+        {TYPOGRAPHY.h6.css};
         color: var(--mantis-text);
     }}
     
     .mantis-body-lg {{
-        font-size: {TYPOGRAPHY.body_lg["size"]};
-        line-height: {TYPOGRAPHY.body_lg["line_height"]};
+        font-size: {TYPOGRAPHY.body_lg.size};
+        line-height: {TYPOGRAPHY.body_lg.line_height};
     }}
     
     .mantis-body-sm {{
-        font-size: {TYPOGRAPHY.body_sm["size"]};
-        line-height: {TYPOGRAPHY.body_sm["line_height"]};
+        font-size: {TYPOGRAPHY.body_sm.size};
+        line-height: {TYPOGRAPHY.body_sm.line_height};
     }}
     
     .mantis-caption {{
-        font-size: {TYPOGRAPHY.caption["size"]};
-        line-height: {TYPOGRAPHY.caption["line_height"]};
+        font-size: {TYPOGRAPHY.caption.size};
+        line-height: {TYPOGRAPHY.caption.line_height};
         color: var(--mantis-text-muted);
     }}
     
     .mantis-overline {{
-        font-size: {TYPOGRAPHY.overline["size"]};
-        font-weight: {TYPOGRAPHY.overline["weight"]};
-        line-height: {TYPOGRAPHY.overline["line_height"]};
-        letter-spacing: {TYPOGRAPHY.overline["letter_spacing"]};
+        {TYPOGRAPHY.overline.css};
         text-transform: uppercase;
         color: var(--mantis-text-muted);
     }}
@@ -227,30 +256,12 @@ def generate_typography_css() -> str:
     """
 
 
+@lru_cache(maxsize=None)
 def generate_component_css() -> str:
     """Generate component CSS using design system"""
-    card_elevated = Components.card_elevated()
-    card_flat = Components.card_flat()
-    pill = Components.pill()
-    
     return f"""
-    /* === Card Components === */
-    .mantis-card {{
-        background: {card_elevated["background"]};
-        border: {card_elevated["border"]};
-        border-radius: {card_elevated["border_radius"]};
-        padding: {card_elevated["padding"]};
-        box-shadow: {card_elevated["box_shadow"]};
-        margin-bottom: {Spacing.MD};
-    }}
-    
-    .mantis-card-flat {{
-        background: {card_flat["background"]};
-        border: {card_flat["border"]};
-        border-radius: {card_flat["border_radius"]};
-        padding: {card_flat["padding"]};
-        box-shadow: {card_flat["box_shadow"]};
-    }}
+    /* === Card & Pill Components === */
+    {COMPONENT_CSS}
     
     .mantis-card-soft {{
         background: var(--mantis-surface-alt);
@@ -259,29 +270,15 @@ def generate_component_css() -> str:
         padding: {Spacing.MD};
     }}
     
-    /* === Pill Component === */
-    .mantis-pill {{
-        display: {pill["display"]};
-        align-items: {pill["align_items"]};
-        gap: {pill["gap"]};
-        padding: {pill["padding"]};
-        border-radius: {pill["border_radius"]};
-        border: {pill["border"]};
-        background: {pill["background"]};
-        font-size: {pill["font_size"]};
-        font-weight: {pill["font_weight"]};
-        color: {pill["color"]};
-    }}
-    
     /* === Navigation Section Headers === */
     .mantis-nav-section {{
         margin-top: {Spacing.MD};
         margin-bottom: {Spacing.SM};
         font-weight: 600;
-        font-size: {TYPOGRAPHY.overline["size"]};
+        font-size: {TYPOGRAPHY.overline.size};
         color: var(--mantis-muted);
         text-transform: uppercase;
-        letter-spacing: {TYPOGRAPHY.overline["letter_spacing"]};
+        letter-spacing: {TYPOGRAPHY.overline.letter_spacing};
     }}
     
     /* === Header Bar === */
@@ -304,18 +301,15 @@ def generate_component_css() -> str:
     }}
     
     .mantis-page-title {{
-        font-size: {TYPOGRAPHY.display_md["size"]};
-        font-weight: {TYPOGRAPHY.display_md["weight"]};
-        line-height: {TYPOGRAPHY.display_md["line_height"]};
-        letter-spacing: {TYPOGRAPHY.display_md["letter_spacing"]};
+        {TYPOGRAPHY.display_md.css};
         color: var(--mantis-text);
         margin-bottom: {Spacing.XS};
     }}
     
     .mantis-page-subtitle {{
-        font-size: {TYPOGRAPHY.body_lg["size"]};
+        font-size: {TYPOGRAPHY.body_lg.size};
         color: var(--mantis-text-secondary);
-        line-height: {TYPOGRAPHY.body_lg["line_height"]};
+        line-height: {TYPOGRAPHY.body_lg.line_height};
     }}
     
     /* === Section Headers === */
@@ -328,14 +322,14 @@ def generate_component_css() -> str:
     }}
     
     .mantis-section-title {{
-        font-size: {TYPOGRAPHY.h3["size"]};
-        font-weight: {TYPOGRAPHY.h3["weight"]};
+        font-size: {TYPOGRAPHY.h3.size};
+        font-weight: {TYPOGRAPHY.h3.weight};
         color: var(--mantis-text);
         margin: 0;
     }}
     
     .mantis-section-caption {{
-        font-size: {TYPOGRAPHY.caption["size"]};
+        font-size: {TYPOGRAPHY.caption.size};
         color: var(--mantis-text-muted);
         margin-top: {Spacing.XS};
     }}
@@ -386,15 +380,15 @@ def generate_component_css() -> str:
     }}
     
     .mantis-stat-label {{
-        font-size: {TYPOGRAPHY.overline["size"]};
+        font-size: {TYPOGRAPHY.overline.size};
         text-transform: uppercase;
-        letter-spacing: {TYPOGRAPHY.overline["letter_spacing"]};
+        letter-spacing: {TYPOGRAPHY.overline.letter_spacing};
         color: var(--mantis-text-muted);
         font-weight: 600;
     }}
     
     .mantis-stat-value {{
-        font-size: {TYPOGRAPHY.h2["size"]};
+        font-size: {TYPOGRAPHY.h2.size};
         font-weight: 700;
         color: var(--mantis-text);
     }}
@@ -414,16 +408,16 @@ def generate_component_css() -> str:
     }}
 
     .mantis-dashboard-title {{
-        font-size: {TYPOGRAPHY.display_md["size"]};
-        font-weight: {TYPOGRAPHY.display_md["weight"]};
-        letter-spacing: {TYPOGRAPHY.display_md["letter_spacing"]};
+        font-size: {TYPOGRAPHY.display_md.size};
+        font-weight: {TYPOGRAPHY.display_md.weight};
+        letter-spacing: {TYPOGRAPHY.display_md.letter_spacing};
         margin: 6px 0 6px 0;
     }}
 
     .mantis-dashboard-sub {{
         color: var(--mantis-text-secondary);
-        font-size: {TYPOGRAPHY.body_lg["size"]};
-        line-height: {TYPOGRAPHY.body_lg["line_height"]};
+        font-size: {TYPOGRAPHY.body_lg.size};
+        line-height: {TYPOGRAPHY.body_lg.line_height};
         margin: 0;
     }}
 
@@ -447,8 +441,8 @@ def generate_component_css() -> str:
     }}
 
     .mantis-panel-title {{
-        font-size: {TYPOGRAPHY.h4["size"]};
-        font-weight: {TYPOGRAPHY.h4["weight"]};
+        font-size: {TYPOGRAPHY.h4.size};
+        font-weight: {TYPOGRAPHY.h4.weight};
         margin: 0 0 {Spacing.XS} 0;
     }}
 
@@ -465,12 +459,12 @@ def generate_component_css() -> str:
 
     .mantis-action-title {{
         font-weight: 700;
-        font-size: {TYPOGRAPHY.h5["size"]};
+        font-size: {TYPOGRAPHY.h5.size};
     }}
 
     .mantis-action-desc {{
         color: var(--mantis-text-muted);
-        font-size: {TYPOGRAPHY.body_sm["size"]};
+        font-size: {TYPOGRAPHY.body_sm.size};
         line-height: 1.5;
     }}
 
@@ -505,40 +499,291 @@ def generate_component_css() -> str:
     }}
     
     .mantis-cta-title {{
-        font-size: {TYPOGRAPHY.h4["size"]};
+        font-size: {TYPOGRAPHY.h4.size};
         font-weight: 600;
         color: var(--mantis-text);
         margin-bottom: {Spacing.XS};
     }}
     
     .mantis-cta-body {{
-        font-size: {TYPOGRAPHY.body_sm["size"]};
+        font-size: {TYPOGRAPHY.body_sm.size};
         color: var(--mantis-text-muted);
         line-height: 1.5;
     }}
+
+    /* === Inline Messages === */
+    .mantis-message {{
+        border: 1px solid var(--mantis-border);
+        border-radius: var(--mantis-radius-md);
+        padding: 12px 16px;
+        color: var(--mantis-text);
+        display: flex;
+        align-items: center;
+        gap: 10px;
+        margin: 12px 0;
+    }}
+
+    .mantis-message-icon {{
+        font-size: 20px;
+    }}
+
+    .mantis-message--success {{
+        background: var(--mantis-accent-soft);
+        border-color: var(--mantis-accent-glow);
+    }}
+
+    .mantis-message--error {{
+        background: rgba(239,68,68,0.12);
+        border-color: rgba(239,68,68,0.3);
+    }}
+
+    .mantis-message--info {{
+        background: rgba(56,189,248,0.12);
+        border-color: rgba(56,189,248,0.3);
+    }}
     """
 
 
-def inject_enhanced_theme(theme: Literal["Dark", "Light"] = "Dark", page_key: str = "") -> None:
-    """Inject enhanced theme with full design system"""
-    del page_key  # Navigation should not force scroll position.
-    theme_vars = generate_theme_css_variables(theme)
-    typography = generate_typography_css()
-    components = generate_component_css()
-    spacing = generate_spacing_css()
-    
-    # Load button CSS from assets
-    from pathlib import Path
-    styles_path = Path(__file__).resolve().parents[2] / "assets" / "styles.css"
-    button_css = ""
+_STYLES_CSS_PATH = Path(__file__).resolve().parents[2] / "assets" / "styles.css"
+
+
+def _styles_mtime() -> int:
+    """Modification time of assets/styles.css in ns (0 when missing)"""
     try:
-        button_css = styles_path.read_text(encoding="utf-8")
+        return _STYLES_CSS_PATH.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@lru_cache(maxsize=1)
+def _load_button_css(mtime_ns: int = 0) -> str:
+    """Read the button system from assets/styles.css ("" when missing)
+
+    *mtime_ns* only keys the cache, so an edited file is read again.
+    """
+    try:
+        return _STYLES_CSS_PATH.read_text(encoding="utf-8")
     except FileNotFoundError:
-        pass
+        return ""
+
+
+# App-wide Streamlit overrides; they only reference CSS variables and
+# design-system constants, so the block is formatted once at import.
+_GLOBAL_CSS = f"""
+        /* === Global Styles === */
+        .stApp {{
+            background-color: var(--mantis-bg);
+            background-image: var(--mantis-bg-glow);
+            color: var(--mantis-text);
+            font-family: 'Inter', sans-serif;
+        }}
+
+        body, html, [data-testid="stAppViewContainer"], [data-testid="stMain"] {{
+            background-color: var(--mantis-bg) !important;
+            color: var(--mantis-text) !important;
+        }}
+
+        [data-testid="stHeader"], [data-testid="stToolbar"] {{
+            display: none !important;
+            height: 0 !important;
+            min-height: 0 !important;
+            visibility: hidden !important;
+            background: var(--mantis-bg) !important;
+        }}
+        /* Remove Streamlit's default sidebar toggle chevrons (<< / >) */
+        [data-testid="collapsedControl"],
+        [data-testid="stSidebarCollapseButton"],
+        [data-testid="stSidebarCollapsedControl"],
+        [aria-label="Collapse sidebar"],
+        [aria-label="Expand sidebar"],
+        [title="Collapse sidebar"],
+        [title="Expand sidebar"],
+        button[kind="headerNoPadding"][aria-label*="sidebar"],
+        button[kind="headerNoPadding"][title*="sidebar"] {{
+            display: none !important;
+            visibility: hidden !important;
+            opacity: 0 !important;
+            pointer-events: none !important;
+            width: 0 !important;
+            height: 0 !important;
+            margin: 0 !important;
+            padding: 0 !important;
+        }}
+        [data-testid="stDecoration"], [data-testid="stStatusWidget"] {{
+            display: none !important;
+            height: 0 !important;
+            min-height: 0 !important;
+            visibility: hidden !important;
+        }}
+
+        section[data-testid="stMain"] div[data-testid="stVerticalBlockBorderWrapper"] {{
+            background: var(--mantis-surface) !important;
+            border-color: var(--mantis-border) !important;
+        }}
+
+        [data-testid="stMain"] .block-container > div > div > div > div {{
+            color: var(--mantis-text) !important;
+        }}
+        
+        .block-container {{
+            padding-top: 0.55rem;
+            padding-bottom: 2.6rem;
+            max-width: 1380px;
+        }}
+
+        div[data-testid="stMainBlockContainer"] {{
+            padding-top: 0.45rem !important;
+        }}
+
+        section[data-testid="stSidebar"] div[data-testid="stSidebarUserContent"] {{
+            padding-top: 0 !important;
+            padding-left: 0.6rem !important;
+            padding-right: 0.6rem !important;
+        }}
+
+        section[data-testid="stSidebar"] .block-container {{
+            padding-top: 0 !important;
+            padding-left: 0.35rem !important;
+            padding-right: 0.35rem !important;
+            padding-bottom: 0.6rem !important;
+        }}
+        
+        header[data-testid="stHeader"] {{
+            display: none !important;
+            height: 0 !important;
+            min-height: 0 !important;
+        }}
+        
+        /* === Streamlit Component Overrides === */
+        .stMarkdown, .stMarkdown p, .stMarkdown span, .stMarkdown li, .stMarkdown div,
+        .stTextInput label, .stSelectbox label, .stCheckbox label, .stRadio label,
+        .stNumberInput label, .stTextArea label {{
+            color: var(--mantis-text) !important;
+        }}
+
+        
+        .stTextInput input,
+        .stNumberInput input,
+        .stTextArea textarea,
+        .stSelectbox div[data-baseweb="select"] > div,
+        .stMultiSelect div[data-baseweb="select"] > div {{
+            background-color: var(--mantis-input-bg) !important;
+            color: var(--mantis-text) !important;
+            border: 1px solid var(--mantis-input-border) !important;
+            border-radius: var(--mantis-radius-md) !important;
+        }}
+        
+        div[data-baseweb="select"] input {{
+            color: var(--mantis-text) !important;
+        }}
+
+        .stTextArea textarea {{
+            font-family: 'Crimson Pro', serif !important;
+            font-size: 18px !important;
+            line-height: 1.65 !important;
+        }}
+
+        /* === Light Mode Consistency === */
+        [data-baseweb="popover"], [role="listbox"] {{
+            background: var(--mantis-surface-raised) !important;
+            color: var(--mantis-text) !important;
+            border: 1px solid var(--mantis-border) !important;
+        }}
+        [role="option"] {{
+            color: var(--mantis-text) !important;
+        }}
+        [role="option"][aria-selected="true"] {{
+            background: var(--mantis-accent-soft) !important;
+        }}
+        .stMetric, .stAlert, .stDataFrame, .stExpander, .element-container div[data-testid="stVerticalBlockBorderWrapper"] {{
+            color: var(--mantis-text) !important;
+        }}
+        /* Streamlit metric internals sometimes keep default colors in light mode */
+        [data-testid="stMetricLabel"], [data-testid="stMetricLabel"] p {{
+            color: var(--mantis-text-secondary) !important;
+        }}
+        [data-testid="stMetricValue"], [data-testid="stMetricValue"] > div, [data-testid="stMetricValue"] p {{
+            color: var(--mantis-text) !important;
+        }}
+        [data-testid="stMetricDelta"], [data-testid="stMetricDelta"] p {{
+            color: var(--mantis-text-muted) !important;
+        }}
+        .stCodeBlock, pre, code {{
+            background: var(--mantis-surface-sunken) !important;
+            color: var(--mantis-text) !important;
+            border-color: var(--mantis-border) !important;
+        }}
+        section[data-testid="stSidebar"] .stSelectbox div[data-baseweb="select"] > div,
+        section[data-testid="stSidebar"] .stTextInput input,
+        section[data-testid="stSidebar"] .stNumberInput input {{
+            background: var(--mantis-input-bg) !important;
+            color: var(--mantis-text) !important;
+        }}
+        
+        /* === Sidebar Styling === */
+        section[data-testid="stSidebar"] {{
+            background: var(--mantis-sidebar-bg);
+            border-right: 1px solid var(--mantis-sidebar-border);
+        }}
+
+        @media (max-width: 760px) {{
+            section[data-testid="stSidebar"] {{
+                width: 100vw !important;
+                min-width: 100vw !important;
+                max-width: 100vw !important;
+                border-right: none !important;
+                box-shadow: 0 0 0 1px var(--mantis-sidebar-border), 0 24px 60px rgba(0,0,0,0.45);
+            }}
+            section[data-testid="stSidebar"] div[data-testid="stSidebarUserContent"] {{
+                padding-left: 1rem !important;
+                padding-right: 1rem !important;
+            }}
+            .block-container {{
+                padding-left: 1rem !important;
+                padding-right: 1rem !important;
+            }}
+        }}
+        
+        section[data-testid="stSidebar"] h3 {{
+            color: var(--mantis-sidebar-title);
+            font-weight: 700;
+            letter-spacing: 0.04em;
+            text-transform: uppercase;
+            font-size: 12px;
+        }}
+        
+        section[data-testid="stSidebar"] .stMarkdown,
+        section[data-testid="stSidebar"] p,
+        section[data-testid="stSidebar"] label {{
+            color: var(--mantis-text);
+        }}
+        
+        /* === Sidebar Brand === */
+        .mantis-sidebar-brand {{
+            display: flex;
+            gap: 12px;
+            align-items: center;
+            padding: 14px 12px;
+            margin: 4px 8px 10px 8px;
+            border-radius: {BorderRadius.LG};
+            background: var(--mantis-sidebar-brand-bg);
+            border: 1px solid var(--mantis-sidebar-brand-border);
+        }}
+        
+        /* === Dividers === */
+        .stDivider {{
+            border-color: var(--mantis-divider) !important;
+        }}
+        
+        /* === Expanders === */
+        .streamlit-expanderHeader {{
+            border-radius: {BorderRadius.MD} !important;
+            border-color: var(--mantis-expander-border) !important;
+            background: var(--mantis-surface-sunken) !important;
+        }}
+"""
 
-    final_theme_overrides = ""
-    if theme == "Light":
-        final_theme_overrides = """
+_LIGHT_OVERRIDES_CSS = """
         /* === Final Light-Mode Enforcement Layer === */
         .stButton > button,
         .stFormSubmitButton > button,
@@ -885,8 +1130,8 @@ def inject_enhanced_theme(theme: Literal["Dark", "Light"] = "Dark", page_key: st
             opacity: 1 !important;
         }
         """
-    else:
-        final_theme_overrides = """
+
+_DARK_OVERRIDES_CSS = """
         /* === Final Dark-Mode Button Enforcement Layer === */
         .stButton > button,
         .stFormSubmitButton > button,
@@ -983,234 +1228,50 @@ def inject_enhanced_theme(theme: Literal["Dark", "Light"] = "Dark", page_key: st
             opacity: 1 !important;
         }
         """
-    
-    st.html(
-        f"""
-        <style>
-        {theme_vars}
-        {typography}
-        {components}
-        {spacing}
-        
-        /* === Global Styles === */
-        .stApp {{
-            background-color: var(--mantis-bg);
-            background-image: var(--mantis-bg-glow);
-            color: var(--mantis-text);
-            font-family: 'Inter', sans-serif;
-        }}
 
-        body, html, [data-testid="stAppViewContainer"], [data-testid="stMain"] {{
-            background-color: var(--mantis-bg) !important;
-            color: var(--mantis-text) !important;
-        }}
 
-        [data-testid="stHeader"], [data-testid="stToolbar"] {{
-            display: none !important;
-            height: 0 !important;
-            min-height: 0 !important;
-            visibility: hidden !important;
-            background: var(--mantis-bg) !important;
-        }}
-        /* Remove Streamlit's default sidebar toggle chevrons (<< / >) */
-        [data-testid="collapsedControl"],
-        [data-testid="stSidebarCollapseButton"],
-        [data-testid="stSidebarCollapsedControl"],
-        [aria-label="Collapse sidebar"],
-        [aria-label="Expand sidebar"],
-        [title="Collapse sidebar"],
-        [title="Expand sidebar"],
-        button[kind="headerNoPadding"][aria-label*="sidebar"],
-        button[kind="headerNoPadding"][title*="sidebar"] {{
-            display: none !important;
-            visibility: hidden !important;
-            opacity: 0 !important;
-            pointer-events: none !important;
-            width: 0 !important;
-            height: 0 !important;
-            margin: 0 !important;
-            padding: 0 !important;
-        }}
-        [data-testid="stDecoration"], [data-testid="stStatusWidget"] {{
-            display: none !important;
-            height: 0 !important;
-            min-height: 0 !important;
-            visibility: hidden !important;
-        }}
-
-        section[data-testid="stMain"] div[data-testid="stVerticalBlockBorderWrapper"] {{
-            background: var(--mantis-surface) !important;
-            border-color: var(--mantis-border) !important;
-        }}
-
-        [data-testid="stMain"] .block-container > div > div > div > div {{
-            color: var(--mantis-text) !important;
-        }}
-        
-        .block-container {{
-            padding-top: 0.55rem;
-            padding-bottom: 2.6rem;
-            max-width: 1380px;
-        }}
-
-        div[data-testid="stMainBlockContainer"] {{
-            padding-top: 0.45rem !important;
-        }}
-
-        section[data-testid="stSidebar"] div[data-testid="stSidebarUserContent"] {{
-            padding-top: 0 !important;
-            padding-left: 0.6rem !important;
-            padding-right: 0.6rem !important;
-        }}
+@lru_cache(maxsize=4)
+def _assemble(theme: Literal["Dark", "Light"], styles_mtime: int = 0) -> str:
+    """Build the complete <style> payload for *theme*
 
-        section[data-testid="stSidebar"] .block-container {{
-            padding-top: 0 !important;
-            padding-left: 0.35rem !important;
-            padding-right: 0.35rem !important;
-            padding-bottom: 0.6rem !important;
-        }}
-        
-        header[data-testid="stHeader"] {{
-            display: none !important;
-            height: 0 !important;
-            min-height: 0 !important;
-        }}
-        
-        /* === Streamlit Component Overrides === */
-        .stMarkdown, .stMarkdown p, .stMarkdown span, .stMarkdown li, .stMarkdown div,
-        .stTextInput label, .stSelectbox label, .stCheckbox label, .stRadio label,
-        .stNumberInput label, .stTextArea label {{
-            color: var(--mantis-text) !important;
-        }}
+    Cached per (theme, styles.css mtime) so edits to the asset show up
+    without restarting the server.
+    """
+    return "".join((
+        "<style>\n",
+        generate_theme_css_variables(theme),
+        generate_typography_css(),
+        generate_component_css(),
+        NAVIGATION_CSS,
+        generate_spacing_css(),
+        _GLOBAL_CSS,
+        "\n/* === Button System from assets/styles.css === */\n",
+        _load_button_css(styles_mtime),
+        _LIGHT_OVERRIDES_CSS if theme == "Light" else _DARK_OVERRIDES_CSS,
+        "\n</style>\n",
+    ))
+
+
+def _warm_theme_cache() -> None:
+    """Assemble both themes ahead of the first render.
+
+    A failure here must not break importing the module; the injector
+    assembles on demand instead.
+    """
+    try:
+        for theme in ("Dark", "Light"):
+            _assemble(theme, _styles_mtime())
+    except Exception:
+        logger.debug("Theme cache warm-up failed", exc_info=True)
 
-        
-        .stTextInput input,
-        .stNumberInput input,
-        .stTextArea textarea,
-        .stSelectbox div[data-baseweb="select"] > div,
-        .stMultiSelect div[data-baseweb="select"] > div {{
-            background-color: var(--mantis-input-bg) !important;
-            color: var(--mantis-text) !important;
-            border: 1px solid var(--mantis-input-border) !important;
-            border-radius: var(--mantis-radius-md) !important;
-        }}
-        
-        div[data-baseweb="select"] input {{
-            color: var(--mantis-text) !important;
-        }}
 
-        .stTextArea textarea {{
-            font-family: 'Crimson Pro', serif !important;
-            font-size: 18px !important;
-            line-height: 1.65 !important;
-        }}
+_warm_theme_cache()
 
-        /* === Light Mode Consistency === */
-        [data-baseweb="popover"], [role="listbox"] {{
-            background: var(--mantis-surface-raised) !important;
-            color: var(--mantis-text) !important;
-            border: 1px solid var(--mantis-border) !important;
-        }}
-        [role="option"] {{
-            color: var(--mantis-text) !important;
-        }}
-        [role="option"][aria-selected="true"] {{
-            background: var(--mantis-accent-soft) !important;
-        }}
-        .stMetric, .stAlert, .stDataFrame, .stExpander, .element-container div[data-testid="stVerticalBlockBorderWrapper"] {{
-            color: var(--mantis-text) !important;
-        }}
-        /* Streamlit metric internals sometimes keep default colors in light mode */
-        [data-testid="stMetricLabel"], [data-testid="stMetricLabel"] p {{
-            color: var(--mantis-text-secondary) !important;
-        }}
-        [data-testid="stMetricValue"], [data-testid="stMetricValue"] > div, [data-testid="stMetricValue"] p {{
-            color: var(--mantis-text) !important;
-        }}
-        [data-testid="stMetricDelta"], [data-testid="stMetricDelta"] p {{
-            color: var(--mantis-text-muted) !important;
-        }}
-        .stCodeBlock, pre, code {{
-            background: var(--mantis-surface-sunken) !important;
-            color: var(--mantis-text) !important;
-            border-color: var(--mantis-border) !important;
-        }}
-        section[data-testid="stSidebar"] .stSelectbox div[data-baseweb="select"] > div,
-        section[data-testid="stSidebar"] .stTextInput input,
-        section[data-testid="stSidebar"] .stNumberInput input {{
-            background: var(--mantis-input-bg) !important;
-            color: var(--mantis-text) !important;
-        }}
-        
-        /* === Sidebar Styling === */
-        section[data-testid="stSidebar"] {{
-            background: var(--mantis-sidebar-bg);
-            border-right: 1px solid var(--mantis-sidebar-border);
-        }}
 
-        @media (max-width: 760px) {{
-            section[data-testid="stSidebar"] {{
-                width: 100vw !important;
-                min-width: 100vw !important;
-                max-width: 100vw !important;
-                border-right: none !important;
-                box-shadow: 0 0 0 1px var(--mantis-sidebar-border), 0 24px 60px rgba(0,0,0,0.45);
-            }}
-            section[data-testid="stSidebar"] div[data-testid="stSidebarUserContent"] {{
-                padding-left: 1rem !important;
-                padding-right: 1rem !important;
-            }}
-            .block-container {{
-                padding-left: 1rem !important;
-                padding-right: 1rem !important;
-            }}
-        }}
-        
-        section[data-testid="stSidebar"] h3 {{
-            color: var(--mantis-sidebar-title);
-            font-weight: 700;
-            letter-spacing: 0.04em;
-            text-transform: uppercase;
-            font-size: 12px;
-        }}
-        
-        section[data-testid="stSidebar"] .stMarkdown,
-        section[data-testid="stSidebar"] p,
-        section[data-testid="stSidebar"] label {{
-            color: var(--mantis-text);
-        }}
-        
-        /* === Sidebar Brand === */
-        .mantis-sidebar-brand {{
-            display: flex;
-            gap: 12px;
-            align-items: center;
-            padding: 14px 12px;
-            margin: 4px 8px 10px 8px;
-            border-radius: {BorderRadius.LG};
-            background: var(--mantis-sidebar-brand-bg);
-            border: 1px solid var(--mantis-sidebar-brand-border);
-        }}
-        
-        /* === Dividers === */
-        .stDivider {{
-            border-color: var(--mantis-divider) !important;
-        }}
-        
-        /* === Expanders === */
-        .streamlit-expanderHeader {{
-            border-radius: {BorderRadius.MD} !important;
-            border-color: var(--mantis-expander-border) !important;
-            background: var(--mantis-surface-sunken) !important;
-        }}
-        
-        /* === Button System from assets/styles.css === */
-        {button_css}
-        {final_theme_overrides}
-        
-        </style>
-        """,
-    )
+def inject_enhanced_theme(theme: Literal["Dark", "Light"] = "Dark", page_key: str = "") -> None:
+    """Inject enhanced theme with full design system"""
+    del page_key  # Navigation should not force scroll position.
+    st.html(_assemble(theme, _styles_mtime()))
 
 
 __all__ = [
@@ -7,113 +7,65 @@ This module provides:
 - Progress bars with estimated time
 """
 
-from typing import Optional, List, Dict, Any
-import streamlit as st
+import re
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from html import escape
+from types import MappingProxyType
+from typing import Callable, Iterator, Mapping, Optional, List, Dict, Any, Sequence, Tuple
 
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,])\s*")
 
-def loading_state(
-    message: str = "Loading...",
-    subtext: Optional[str] = None,
-    show_spinner: bool = True,
-) -> None:
-    """Display an enhanced loading state with clear messaging.
-    
-    Args:
-        message: Primary loading message
-        subtext: Optional additional context (e.g., "this may take ~10 seconds")
-        show_spinner: Whether to show an animated spinner
-    """
-    html = f"""
-    <div class="mantis-loading-state">
-        {'<div class="mantis-spinner"></div>' if show_spinner else ''}
-        <div class="mantis-loading-message">{message}</div>
-        {f'<div class="mantis-loading-subtext">{subtext}</div>' if subtext else ''}
-    </div>
+
+def _minify_css(css: str) -> str:
+    """Drop comments and layout whitespace from a static stylesheet."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    return _CSS_PUNCT_RE.sub(r"\1", css).strip()
+
+
+# The component stylesheets are static, so they are kept as module constants,
+# minified once at import, and only the markup is formatted per call.
+_LOADING_CSS = _minify_css("""
     <style>
-    .mantis-loading-state {{
+    .mantis-loading-state {
         display: flex;
         flex-direction: column;
         align-items: center;
         justify-content: center;
         padding: 2rem;
         gap: 1rem;
-    }}
-    .mantis-spinner {{
+    }
+    .mantis-spinner {
         width: 40px;
         height: 40px;
         border: 3px solid var(--mantis-card-border, rgba(148, 163, 184, 0.15));
         border-top-color: var(--mantis-accent, #22c55e);
         border-radius: 50%;
         animation: mantis-spin 0.8s linear infinite;
-    }}
-    @keyframes mantis-spin {{
-        to {{ transform: rotate(360deg); }}
-    }}
-    .mantis-loading-message {{
+    }
+    @keyframes mantis-spin {
+        to { transform: rotate(360deg); }
+    }
+    .mantis-loading-message {
         font-size: 16px;
         font-weight: 600;
         color: var(--mantis-text, #e2e8f0);
-    }}
-    .mantis-loading-subtext {{
+    }
+    .mantis-loading-subtext {
         font-size: 13px;
         color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
-    }}
+    }
     </style>
-    """
-    st.html(html)
+""")
 
-
-def step_indicator(
-    steps: List[str],
-    current_step: int,
-    completed_steps: Optional[List[int]] = None,
-) -> None:
-    """Display a step-by-step workflow indicator.
-    
-    Args:
-        steps: List of step labels
-        current_step: Index of the current step (0-based)
-        completed_steps: List of completed step indices (default: all before current)
-    """
-    if completed_steps is None:
-        completed_steps = list(range(current_step))
-    
-    steps_html = []
-    for i, step_label in enumerate(steps):
-        is_completed = i in completed_steps
-        is_current = i == current_step
-        is_future = i > current_step and not is_completed
-        
-        step_class = "mantis-step"
-        if is_completed:
-            step_class += " mantis-step-completed"
-        elif is_current:
-            step_class += " mantis-step-current"
-        elif is_future:
-            step_class += " mantis-step-future"
-        
-        icon = "" if is_completed else str(i + 1)
-        
-        steps_html.append(f"""
-        <div class="{step_class}">
-            <div class="mantis-step-icon">{icon}</div>
-            <div class="mantis-step-label">{step_label}</div>
-        </div>
-        """)
-        
-        # Add connector line between steps (except after last step)
-        if i < len(steps) - 1:
-            connector_class = "mantis-step-connector"
-            if is_completed:
-                connector_class += " mantis-step-connector-completed"
-            steps_html.append(f'<div class="{connector_class}"></div>')
-    
-    html = f"""
-    <div class="mantis-step-indicator">
-        {''.join(steps_html)}
-    </div>
+_STEP_CSS = _minify_css("""
     <style>
-    .mantis-step-indicator {{
+    .mantis-step-indicator {
         display: flex;
         align-items: center;
         justify-content: space-between;
@@ -122,15 +74,15 @@ def step_indicator(
         background: var(--mantis-surface-alt, rgba(5,14,11,0.9));
         border-radius: 16px;
         border: 1px solid var(--mantis-card-border, rgba(148, 163, 184, 0.15));
-    }}
-    .mantis-step {{
+    }
+    .mantis-step {
         display: flex;
         flex-direction: column;
         align-items: center;
         gap: 0.5rem;
         flex: 0 0 auto;
-    }}
-    .mantis-step-icon {{
+    }
+    .mantis-step-icon {
         width: 36px;
         height: 36px;
         border-radius: 50%;
@@ -143,138 +95,112 @@ def step_indicator(
         background: var(--mantis-surface, rgba(6,18,14,0.85));
         color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
         transition: all 0.3s ease;
-    }}
-    .mantis-step-label {{
+    }
+    .mantis-step-label {
         font-size: 12px;
         font-weight: 500;
         color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
         text-align: center;
         max-width: 100px;
-    }}
-    .mantis-step-completed .mantis-step-icon {{
+    }
+    .mantis-step-completed .mantis-step-icon {
         background: var(--mantis-accent, #22c55e);
         border-color: var(--mantis-accent, #22c55e);
         color: #ffffff;
-    }}
-    .mantis-step-completed .mantis-step-label {{
+    }
+    .mantis-step-completed .mantis-step-label {
         color: var(--mantis-text, #e2e8f0);
-    }}
-    .mantis-step-current .mantis-step-icon {{
+    }
+    .mantis-step-current .mantis-step-icon {
         border-color: var(--mantis-accent, #22c55e);
         color: var(--mantis-accent, #22c55e);
         box-shadow: 0 0 0 4px var(--mantis-accent-glow, rgba(34,197,94,0.25));
         animation: mantis-pulse 2s ease-in-out infinite;
-    }}
-    .mantis-step-current .mantis-step-label {{
+    }
+    .mantis-step-current .mantis-step-label {
         color: var(--mantis-text, #e2e8f0);
         font-weight: 600;
-    }}
-    @keyframes mantis-pulse {{
-        0%, 100% {{ box-shadow: 0 0 0 4px var(--mantis-accent-glow, rgba(34,197,94,0.25)); }}
-        50% {{ box-shadow: 0 0 0 8px var(--mantis-accent-glow, rgba(34,197,94,0.15)); }}
-    }}
-    .mantis-step-future .mantis-step-icon {{
+    }
+    @keyframes mantis-pulse {
+        0%, 100% { box-shadow: 0 0 0 4px var(--mantis-accent-glow, rgba(34,197,94,0.25)); }
+        50% { box-shadow: 0 0 0 8px var(--mantis-accent-glow, rgba(34,197,94,0.15)); }
+    }
+    .mantis-step-future .mantis-step-icon {
         background: var(--mantis-surface, rgba(6,18,14,0.85));
         opacity: 0.5;
-    }}
-    .mantis-step-connector {{
+    }
+    .mantis-step-connector {
         flex: 1;
         height: 2px;
         background: var(--mantis-card-border, rgba(148, 163, 184, 0.15));
         margin: 0 0.5rem;
         position: relative;
         top: -18px;
-    }}
-    .mantis-step-connector-completed {{
+    }
+    .mantis-step-connector-completed {
         background: var(--mantis-accent, #22c55e);
-    }}
-    @media (max-width: 768px) {{
-        .mantis-step-indicator {{
+    }
+    @media (max-width: 768px) {
+        .mantis-step-indicator {
             flex-direction: column;
             align-items: flex-start;
-        }}
-        .mantis-step {{
+        }
+        .mantis-step {
             flex-direction: row;
             width: 100%;
-        }}
-        .mantis-step-label {{
+        }
+        .mantis-step-label {
             text-align: left;
             max-width: none;
-        }}
-        .mantis-step-connector {{
+        }
+        .mantis-step-connector {
             width: 2px;
             height: 20px;
             margin: 0.5rem 0 0.5rem 17px;
             top: 0;
-        }}
-    }}
+        }
+    }
     </style>
-    """
-    st.html(html)
+""")
 
-
-def progress_bar_with_message(
-    progress: float,
-    message: str = "",
-    estimated_time: Optional[str] = None,
-) -> None:
-    """Display a progress bar with message and optional time estimate.
-    
-    Args:
-        progress: Progress value from 0.0 to 1.0
-        message: Status message to display
-        estimated_time: Optional time estimate (e.g., "~2 minutes remaining")
-    """
-    progress_percent = int(progress * 100)
-    
-    html = f"""
-    <div class="mantis-progress-container">
-        <div class="mantis-progress-header">
-            <span class="mantis-progress-message">{message}</span>
-            {f'<span class="mantis-progress-time">{estimated_time}</span>' if estimated_time else ''}
-        </div>
-        <div class="mantis-progress-bar">
-            <div class="mantis-progress-fill" style="width: {progress_percent}%"></div>
-        </div>
-        <div class="mantis-progress-percent">{progress_percent}%</div>
-    </div>
+_PROGRESS_CSS = _minify_css("""
     <style>
-    .mantis-progress-container {{
+    .mantis-progress-container {
         padding: 1rem;
         background: var(--mantis-surface-alt, rgba(5,14,11,0.9));
         border-radius: 12px;
         border: 1px solid var(--mantis-card-border, rgba(148, 163, 184, 0.15));
-    }}
-    .mantis-progress-header {{
+    }
+    .mantis-progress-header {
         display: flex;
         justify-content: space-between;
         align-items: center;
         margin-bottom: 0.75rem;
-    }}
-    .mantis-progress-message {{
+    }
+    .mantis-progress-message {
         font-size: 14px;
         font-weight: 600;
         color: var(--mantis-text, #e2e8f0);
-    }}
-    .mantis-progress-time {{
+    }
+    .mantis-progress-time {
         font-size: 12px;
         color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
-    }}
-    .mantis-progress-bar {{
+    }
+    .mantis-progress-bar {
         height: 8px;
         background: var(--mantis-card-border, rgba(148, 163, 184, 0.15));
         border-radius: 999px;
         overflow: hidden;
         position: relative;
-    }}
-    .mantis-progress-fill {{
+    }
+    .mantis-progress-fill {
         height: 100%;
         background: linear-gradient(90deg, var(--mantis-accent, #22c55e), var(--mantis-accent-glow, #4ade80));
         border-radius: 999px;
         transition: width 0.3s ease;
         position: relative;
-    }}
-    .mantis-progress-fill::after {{
+    }
+    .mantis-progress-fill::after {
         content: '';
         position: absolute;
         top: 0;
@@ -282,63 +208,32 @@ def progress_bar_with_message(
         right: 0;
         bottom: 0;
         background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent);
-        animation: mantis-shimmer 2s infinite;
-    }}
-    @keyframes mantis-shimmer {{
-        0% {{ transform: translateX(-100%); }}
-        100% {{ transform: translateX(100%); }}
-    }}
-    .mantis-progress-percent {{
+    }
+    @media (prefers-reduced-motion: no-preference) {
+        .mantis-progress-fill:not([data-complete="true"])::after {
+            animation: mantis-shimmer 2s infinite;
+        }
+        @keyframes mantis-shimmer {
+            0% { transform: translateX(-100%); }
+            100% { transform: translateX(100%); }
+        }
+    }
+    .mantis-progress-fill[data-complete="true"]::after {
+        display: none;
+    }
+    .mantis-progress-percent {
         text-align: right;
         font-size: 12px;
         font-weight: 600;
         color: var(--mantis-accent, #22c55e);
         margin-top: 0.5rem;
-    }}
+    }
     </style>
-    """
-    st.html(html)
-
+""")
 
-def feedback_message(
-    message: str,
-    message_type: str = "success",
-    icon: Optional[str] = None,
-    dismissible: bool = True,
-) -> None:
-    """Display a feedback message with appropriate styling.
-    
-    Args:
-        message: The feedback message to display
-        message_type: Message type - "success", "error", "warning", "info"
-        icon: Optional custom icon (default: auto-selected based on message_type)
-        dismissible: Whether the message can be dismissed
-    """
-    default_icons = {
-        "success": "",
-        "error": "",
-        "warning": "",
-        "info": "",
-    }
-    
-    icon_display = icon or default_icons.get(message_type, "")
-    
-    type_classes = {
-        "success": "mantis-feedback-success",
-        "error": "mantis-feedback-error",
-        "warning": "mantis-feedback-warning",
-        "info": "mantis-feedback-info",
-    }
-    
-    feedback_class = type_classes.get(message_type, "mantis-feedback-info")
-    
-    html = f"""
-    <div class="mantis-feedback-message {feedback_class}">
-        <div class="mantis-feedback-icon">{icon_display}</div>
-        <div class="mantis-feedback-text">{message}</div>
-    </div>
+_FEEDBACK_CSS = _minify_css("""
     <style>
-    .mantis-feedback-message {{
+    .mantis-feedback-message {
         display: flex;
         align-items: center;
         gap: 0.75rem;
@@ -347,62 +242,341 @@ def feedback_message(
         margin-bottom: 1rem;
         border: 1px solid;
         animation: mantis-slide-in 0.3s ease-out;
-    }}
-    @keyframes mantis-slide-in {{
-        from {{
+    }
+    @keyframes mantis-slide-in {
+        from {
             opacity: 0;
             transform: translateY(-10px);
-        }}
-        to {{
+        }
+        to {
             opacity: 1;
             transform: translateY(0);
-        }}
-    }}
-    .mantis-feedback-icon {{
+        }
+    }
+    .mantis-feedback-icon {
         font-size: 18px;
         font-weight: 700;
         flex-shrink: 0;
-    }}
-    .mantis-feedback-text {{
+    }
+    .mantis-feedback-text {
         flex: 1;
         font-size: 14px;
         line-height: 1.5;
-    }}
-    .mantis-feedback-success {{
-        background: rgba(34, 197, 94, 0.12);
-        border-color: rgba(34, 197, 94, 0.35);
-        color: var(--mantis-text, #e2e8f0);
-    }}
-    .mantis-feedback-success .mantis-feedback-icon {{
-        color: var(--mantis-success, #22c55e);
-    }}
-    .mantis-feedback-error {{
-        background: rgba(239, 68, 68, 0.12);
-        border-color: rgba(239, 68, 68, 0.35);
-        color: var(--mantis-text, #e2e8f0);
-    }}
-    .mantis-feedback-error .mantis-feedback-icon {{
-        color: #ef4444;
-    }}
-    .mantis-feedback-warning {{
-        background: rgba(245, 158, 11, 0.12);
-        border-color: rgba(245, 158, 11, 0.35);
+    }
+    .mantis-feedback-success,
+    .mantis-feedback-error,
+    .mantis-feedback-warning,
+    .mantis-feedback-info {
+        background: rgba(var(--fb-rgb), 0.12);
+        border-color: rgba(var(--fb-rgb), 0.35);
         color: var(--mantis-text, #e2e8f0);
-    }}
-    .mantis-feedback-warning .mantis-feedback-icon {{
-        color: var(--mantis-warning, #f59e0b);
-    }}
-    .mantis-feedback-info {{
-        background: rgba(56, 189, 248, 0.12);
-        border-color: rgba(56, 189, 248, 0.35);
+    }
+    .mantis-feedback-message .mantis-feedback-icon {
+        color: var(--fb-icon);
+    }
+    .mantis-feedback-success { --fb-rgb: 34, 197, 94; --fb-icon: var(--mantis-success, #22c55e); }
+    .mantis-feedback-error { --fb-rgb: 239, 68, 68; --fb-icon: #ef4444; }
+    .mantis-feedback-warning { --fb-rgb: 245, 158, 11; --fb-icon: var(--mantis-warning, #f59e0b); }
+    .mantis-feedback-info { --fb-rgb: 56, 189, 248; --fb-icon: #38bdf8; }
+    </style>
+""")
+
+_PAGE_HEADER_CSS = _minify_css("""
+    <style>
+    .mantis-page-header {
+        margin-bottom: 2rem;
+        padding-bottom: 1.5rem;
+        border-bottom: 1px solid var(--mantis-divider, #143023);
+    }
+    .mantis-breadcrumbs {
+        font-size: 12px;
+        color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
+        margin-bottom: 0.75rem;
+        letter-spacing: 0.02em;
+    }
+    .mantis-breadcrumb-item:not(:last-child) {
+        opacity: 0.7;
+    }
+    .mantis-page-title-row {
+        display: flex;
+        align-items: center;
+        gap: 0.75rem;
+    }
+    .mantis-page-icon {
+        font-size: 32px;
+        line-height: 1;
+    }
+    .mantis-page-title {
+        font-size: 28px;
+        font-weight: 700;
+        margin: 0;
         color: var(--mantis-text, #e2e8f0);
-    }}
-    .mantis-feedback-info .mantis-feedback-icon {{
-        color: #38bdf8;
-    }}
+        letter-spacing: -0.02em;
+    }
+    .mantis-page-subtitle {
+        font-size: 15px;
+        color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
+        margin-top: 0.5rem;
+        line-height: 1.5;
+    }
     </style>
+""")
+
+
+def loading_state(
+    message: str = "Loading...",
+    subtext: Optional[str] = None,
+    show_spinner: bool = True,
+) -> None:
+    """Display an enhanced loading state with clear messaging.
+    
+    Args:
+        message: Primary loading message
+        subtext: Optional additional context (e.g., "this may take ~10 seconds")
+        show_spinner: Whether to show an animated spinner
     """
-    st.html(html)
+    html = _LOADING_TMPL.format(
+        spinner=_SPINNER_HTML if show_spinner else "",
+        message=escape(message),
+        subtext=_LOADING_SUBTEXT_TMPL.format(escape(subtext)) if subtext else "",
+    )
+    _emit(html + _LOADING_CSS)
+
+
+# Markup templates for the per-call part of each component.
+_SPINNER_HTML = '<div class="mantis-spinner"></div>'
+_LOADING_TMPL = (
+    '<div class="mantis-loading-state">{spinner}'
+    '<div class="mantis-loading-message">{message}</div>{subtext}</div>'
+)
+_LOADING_SUBTEXT_TMPL = '<div class="mantis-loading-subtext">{}</div>'
+_PROGRESS_TMPL = (
+    '<div class="mantis-progress-container">'
+    '<div class="mantis-progress-header">'
+    '<span class="mantis-progress-message">{message}</span>{time}</div>'
+    '<div class="mantis-progress-bar">'
+    '<div class="mantis-progress-fill" data-complete="{complete}" style="width: {percent}%"></div></div>'
+    '<div class="mantis-progress-percent">{percent}%</div></div>'
+)
+_PROGRESS_TIME_TMPL = '<span class="mantis-progress-time">{}</span>'
+_FEEDBACK_TMPL = (
+    '<div class="mantis-feedback-message {cls}">'
+    '<div class="mantis-feedback-icon">{icon}</div>'
+    '<div class="mantis-feedback-text">{text}</div></div>'
+)
+_CRUMB_FMT = '<span class="mantis-breadcrumb-item">{}</span>'.format
+
+# (css class, default icon) per message type; the variant colours come from
+# the CSS custom properties keyed on the class.
+_FEEDBACK_META: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    "success": ("mantis-feedback-success", ""),
+    "error": ("mantis-feedback-error", ""),
+    "warning": ("mantis-feedback-warning", ""),
+    "info": ("mantis-feedback-info", ""),
+})
+
+# Per-thread buffer of markup collected by ``feedback_batch``; each Streamlit
+# session runs its script on its own thread.
+_BATCH = threading.local()
+
+
+def _emit(markup: str) -> None:
+    """Send *markup* to Streamlit, or to the active batch if there is one."""
+    buffer = getattr(_BATCH, "buffer", None)
+    if buffer is None:
+        import streamlit as st
+
+        st.html(markup)
+    else:
+        buffer.append(markup)
+
+
+@contextmanager
+def feedback_batch() -> Iterator[None]:
+    """Collect the feedback components rendered inside the block into one element.
+    
+    Example:
+        with feedback_batch():
+            page_header("Import")
+            step_indicator(["Upload", "Analyze"], current_step=0)
+    """
+    outer = getattr(_BATCH, "buffer", None)
+    buffer: List[str] = []
+    _BATCH.buffer = buffer
+    try:
+        yield
+    finally:
+        _BATCH.buffer = outer
+        if buffer:
+            if outer is None:
+                import streamlit as st
+
+                st.html("".join(buffer))
+            else:
+                outer.extend(buffer)
+
+
+_STEP_TMPL = (
+    '<div class="{cls}"><div class="mantis-step-icon">{icon}</div>'
+    '<div class="mantis-step-label">{label}</div></div>'
+)
+# Step states, in the order the pre-rendered fragments are stored.
+_STEP_COMPLETED, _STEP_CURRENT, _STEP_FUTURE, _STEP_PASSED = range(4)
+_STEP_CLASSES = (
+    "mantis-step mantis-step-completed",
+    "mantis-step mantis-step-current",
+    "mantis-step mantis-step-future",
+    "mantis-step",
+)
+_CONN_HTML = '<div class="mantis-step-connector"></div>'
+_CONN_COMPLETED_HTML = '<div class="mantis-step-connector mantis-step-connector-completed"></div>'
+
+
+@lru_cache(maxsize=64)
+def _step_fragments(steps: Tuple[str, ...]) -> Tuple[Tuple[str, ...], ...]:
+    """Pre-render every step of a workflow in each of its four states."""
+    return tuple(
+        tuple(
+            _STEP_TMPL.format(
+                cls=cls,
+                icon="" if state == _STEP_COMPLETED else str(i + 1),
+                label=escape(label),
+            )
+            for state, cls in enumerate(_STEP_CLASSES)
+        )
+        for i, label in enumerate(steps)
+    )
+
+
+def step_indicator(
+    steps: Sequence[str],
+    current_step: int,
+    completed_steps: Optional[List[int]] = None,
+) -> None:
+    """Display a step-by-step workflow indicator.
+    
+    Args:
+        steps: List of step labels
+        current_step: Index of the current step (0-based)
+        completed_steps: List of completed step indices (default: all before current)
+    """
+    if completed_steps is None:
+        completed_steps = list(range(current_step))
+    completed = set(completed_steps)
+    
+    steps_html = []
+    fragments = _step_fragments(tuple(steps))
+    last_index = len(fragments) - 1
+    for i, states in enumerate(fragments):
+        is_completed = i in completed
+        if is_completed:
+            state = _STEP_COMPLETED
+        elif i == current_step:
+            state = _STEP_CURRENT
+        elif i > current_step:
+            state = _STEP_FUTURE
+        else:
+            state = _STEP_PASSED
+        steps_html.append(states[state])
+        
+        # Add connector line between steps (except after last step)
+        if i < last_index:
+            steps_html.append(_CONN_COMPLETED_HTML if is_completed else _CONN_HTML)
+    
+    html = '<div class="mantis-step-indicator">' + "".join(steps_html) + "</div>"
+    _emit(html + _STEP_CSS)
+
+
+def make_step_renderer(steps: Sequence[str]) -> Callable[..., None]:
+    """Return a ``step_indicator`` bound to a fixed workflow.
+    
+    The step fragments are rendered up front, so each call only picks the
+    fragment for every step's current state.
+    
+    Args:
+        steps: Step labels for the workflow
+    """
+    frozen_steps = tuple(steps)
+    _step_fragments(frozen_steps)
+    
+    def render(current_step: int, completed_steps: Optional[List[int]] = None) -> None:
+        step_indicator(frozen_steps, current_step, completed_steps)
+    
+    return render
+
+
+def progress_bar_with_message(
+    progress: float,
+    message: str = "",
+    estimated_time: Optional[str] = None,
+    key: Optional[str] = None,
+    min_interval_ms: float = 100,
+) -> None:
+    """Display a progress bar with message and optional time estimate.
+    
+    Args:
+        progress: Progress value from 0.0 to 1.0
+        message: Status message to display
+        estimated_time: Optional time estimate (e.g., "~2 minutes remaining")
+        key: Optional stable key; when given, updates for the same key are
+            throttled to one per ``min_interval_ms`` until progress reaches 1.0.
+            A throttled call re-emits the last rendered bar, so the bar stays
+            on the page across reruns.
+        min_interval_ms: Minimum time between throttled updates
+    """
+    if key is not None:
+        import streamlit as st
+
+        state_key = f"_mantis_pb_last_{key}"
+        now = time.monotonic()
+        last = st.session_state.get(state_key)
+        if progress < 1.0 and last is not None and now - last[0] < min_interval_ms / 1000:
+            _emit(last[1])
+            return
+    
+    progress_percent = int(progress * 100)
+    
+    html = _PROGRESS_TMPL.format(
+        message=escape(message),
+        time=_PROGRESS_TIME_TMPL.format(escape(estimated_time)) if estimated_time else "",
+        percent=progress_percent,
+        complete="true" if progress >= 1.0 else "false",
+    ) + _PROGRESS_CSS
+    if key is not None:
+        st.session_state[state_key] = (now, html)
+    _emit(html)
+
+
+@lru_cache(maxsize=256)
+def _feedback_html(message: str, message_type: str, icon: Optional[str]) -> str:
+    """Render a feedback row; repeats like "Saved." hit the cache.
+
+    ``dismissible`` does not affect the markup, so it is not part of the key.
+    """
+    feedback_class, default_icon = _FEEDBACK_META.get(message_type, _FEEDBACK_META["info"])
+    html = _FEEDBACK_TMPL.format(
+        cls=feedback_class,
+        icon=escape(icon or default_icon),
+        text=escape(message),
+    )
+    return html + _FEEDBACK_CSS
+
+
+def feedback_message(
+    message: str,
+    message_type: str = "success",
+    icon: Optional[str] = None,
+    dismissible: bool = True,
+) -> None:
+    """Display a feedback message with appropriate styling.
+    
+    Args:
+        message: The feedback message to display
+        message_type: Message type - "success", "error", "warning", "info"
+        icon: Optional custom icon (default: auto-selected based on message_type)
+        dismissible: Whether the message can be dismissed
+    """
+    _emit(_feedback_html(message, message_type, icon))
 
 
 def page_header(
@@ -421,59 +595,21 @@ def page_header(
     """
     breadcrumbs_html = ""
     if breadcrumbs:
-        crumbs = "  ".join(f'<span class="mantis-breadcrumb-item">{crumb}</span>' for crumb in breadcrumbs)
+        crumbs = "  ".join(map(_CRUMB_FMT, map(escape, breadcrumbs)))
         breadcrumbs_html = f'<div class="mantis-breadcrumbs">{crumbs}</div>'
     
-    icon_html = f'<span class="mantis-page-icon">{icon}</span>' if icon else ''
-    subtitle_html = f'<div class="mantis-page-subtitle">{subtitle}</div>' if subtitle else ''
+    icon_html = f'<span class="mantis-page-icon">{escape(icon)}</span>' if icon else ''
+    subtitle_html = f'<div class="mantis-page-subtitle">{escape(subtitle)}</div>' if subtitle else ''
     
     html = f"""
     <div class="mantis-page-header">
         {breadcrumbs_html}
         <div class="mantis-page-title-row">
             {icon_html}
-            <h1 class="mantis-page-title">{title}</h1>
+            <h1 class="mantis-page-title">{escape(title)}</h1>
         </div>
         {subtitle_html}
     </div>
-    <style>
-    .mantis-page-header {{
-        margin-bottom: 2rem;
-        padding-bottom: 1.5rem;
-        border-bottom: 1px solid var(--mantis-divider, #143023);
-    }}
-    .mantis-breadcrumbs {{
-        font-size: 12px;
-        color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
-        margin-bottom: 0.75rem;
-        letter-spacing: 0.02em;
-    }}
-    .mantis-breadcrumb-item:not(:last-child) {{
-        opacity: 0.7;
-    }}
-    .mantis-page-title-row {{
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-    }}
-    .mantis-page-icon {{
-        font-size: 32px;
-        line-height: 1;
-    }}
-    .mantis-page-title {{
-        font-size: 28px;
-        font-weight: 700;
-        margin: 0;
-        color: var(--mantis-text, #e2e8f0);
-        letter-spacing: -0.02em;
-    }}
-    .mantis-page-subtitle {{
-        font-size: 15px;
-        color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
-        margin-top: 0.5rem;
-        line-height: 1.5;
-    }}
-    </style>
     """
-    st.html(html)
+    _emit(html + _PAGE_HEADER_CSS)
 
@@ -6,60 +6,17 @@ This module provides:
 - Context-aware help and guidance
 """
 
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Callable, Any, Sequence, Tuple
 import streamlit as st
 
 
-def render_nav_section(
-    title: str,
-    items: List[Dict[str, Any]],
-    current_page: str,
-) -> None:
-    """Render a navigation section in the sidebar with grouped items.
-    
-    Args:
-        title: Section title (e.g., "Core", "Tools", "Settings")
-        items: List of navigation items, each with 'label', 'page', 'icon', optional 'badge'
-        current_page: Currently active page key
-    """
-    html_items = []
-    
-    for item in items:
-        label = item.get('label', '')
-        page = item.get('page', '')
-        icon = item.get('icon', '')
-        badge = item.get('badge')
-        disabled = item.get('disabled', False)
-        
-        is_active = page == current_page
-        item_class = "mantis-nav-item"
-        if is_active:
-            item_class += " mantis-nav-item-active"
-        if disabled:
-            item_class += " mantis-nav-item-disabled"
-        
-        badge_html = f'<span class="mantis-nav-badge">{badge}</span>' if badge else ''
-        
-        html_items.append(f"""
-        <div class="{item_class}" data-page="{page}">
-            <div class="mantis-nav-icon">{icon}</div>
-            <div class="mantis-nav-label">{label}</div>
-            {badge_html}
-        </div>
-        """)
-    
-    html = f"""
-    <div class="mantis-nav-section-container">
-        <div class="mantis-nav-section-title">{title}</div>
-        <div class="mantis-nav-section-items">
-            {''.join(html_items)}
-        </div>
-    </div>
-    <style>
-    .mantis-nav-section-container {{
+# Styles for every component in this module. They ship once inside the theme
+# payload (see app.ui.enhanced_theme) rather than with each rendered instance.
+NAVIGATION_CSS = """
+    .mantis-nav-section-container {
         margin-bottom: 1.5rem;
-    }}
-    .mantis-nav-section-title {{
+    }
+    .mantis-nav-section-title {
         font-size: 11px;
         font-weight: 700;
         text-transform: uppercase;
@@ -67,13 +24,13 @@ def render_nav_section(
         color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
         margin-bottom: 0.75rem;
         padding: 0 0.5rem;
-    }}
-    .mantis-nav-section-items {{
+    }
+    .mantis-nav-section-items {
         display: flex;
         flex-direction: column;
         gap: 0.25rem;
-    }}
-    .mantis-nav-item {{
+    }
+    .mantis-nav-item {
         display: flex;
         align-items: center;
         gap: 0.75rem;
@@ -84,16 +41,16 @@ def render_nav_section(
         background: transparent;
         border: 1px solid transparent;
         position: relative;
-    }}
-    .mantis-nav-item:hover:not(.mantis-nav-item-disabled) {{
+    }
+    .mantis-nav-item:hover:not(.mantis-nav-item-disabled) {
         background: var(--mantis-surface-alt, rgba(5,14,11,0.9));
         border-color: var(--mantis-accent-glow, rgba(34,197,94,0.25));
-    }}
-    .mantis-nav-item-active {{
+    }
+    .mantis-nav-item-active {
         background: var(--mantis-accent-soft, rgba(34,197,94,0.12));
         border-color: var(--mantis-accent-glow, rgba(34,197,94,0.35));
-    }}
-    .mantis-nav-item-active::before {{
+    }
+    .mantis-nav-item-active::before {
         content: '';
         position: absolute;
         left: 0;
@@ -103,53 +60,193 @@ def render_nav_section(
         height: 60%;
         background: var(--mantis-accent, #22c55e);
         border-radius: 0 2px 2px 0;
-    }}
-    .mantis-nav-item-disabled {{
+    }
+    .mantis-nav-item-disabled {
         opacity: 0.4;
         cursor: not-allowed;
-    }}
-    .mantis-nav-icon {{
+    }
+    .mantis-nav-icon {
         font-size: 18px;
         line-height: 1;
         flex-shrink: 0;
         width: 20px;
         text-align: center;
-    }}
-    .mantis-nav-label {{
+    }
+    .mantis-nav-label {
         flex: 1;
         font-size: 14px;
         font-weight: 500;
         color: var(--mantis-text, #e2e8f0);
-    }}
-    .mantis-nav-badge {{
+    }
+    .mantis-nav-badge {
         font-size: 10px;
         font-weight: 700;
         padding: 2px 6px;
         border-radius: 999px;
         background: var(--mantis-accent, #22c55e);
         color: #ffffff;
-    }}
-    </style>
-    <script>
-    // Add click handlers to navigation items
-    document.querySelectorAll('.mantis-nav-item:not(.mantis-nav-item-disabled)').forEach(item => {{
-        item.addEventListener('click', () => {{
-            const page = item.getAttribute('data-page');
-            if (page) {{
-                // Use Streamlit's query params to trigger navigation
-                window.parent.postMessage({{
-                    type: 'streamlit:setQueryParams',
-                    queryParams: {{ page: page }}
-                }}, '*');
-                // Also trigger a rerun by clicking a hidden button
-                const navButton = window.parent.document.querySelector(`[data-testid="stButton"] button[id*="${{page}}"]`);
-                if (navButton) navButton.click();
-            }}
-        }});
-    }});
-    </script>
+    }
+    .mantis-help-tooltip {
+        display: flex;
+        gap: 0.75rem;
+        padding: 0.875rem 1rem;
+        background: rgba(56, 189, 248, 0.08);
+        border: 1px solid rgba(56, 189, 248, 0.25);
+        border-radius: 10px;
+        margin: 1rem 0;
+    }
+    .mantis-help-icon {
+        font-size: 20px;
+        line-height: 1;
+        flex-shrink: 0;
+    }
+    .mantis-help-content {
+        flex: 1;
+    }
+    .mantis-help-title {
+        font-weight: 600;
+        font-size: 13px;
+        color: var(--mantis-text, #e2e8f0);
+        margin-bottom: 0.25rem;
+    }
+    .mantis-help-text {
+        font-size: 13px;
+        color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
+        line-height: 1.5;
+    }
+    .mantis-empty-state {
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        justify-content: center;
+        text-align: center;
+        padding: 3rem 2rem;
+        margin: 2rem 0;
+    }
+    .mantis-empty-icon {
+        font-size: 48px;
+        margin-bottom: 1rem;
+        opacity: 0.7;
+    }
+    .mantis-empty-title {
+        font-size: 20px;
+        font-weight: 700;
+        color: var(--mantis-text, #e2e8f0);
+        margin-bottom: 0.5rem;
+    }
+    .mantis-empty-desc {
+        font-size: 14px;
+        color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
+        line-height: 1.6;
+        max-width: 400px;
+        margin-bottom: 1.5rem;
+    }
+    [class*="st-key-mantis_quick_action_"] .stButton button {
+        display: flex;
+        align-items: center;
+        justify-content: flex-start;
+        gap: 1rem;
+        padding: 1rem 1.25rem;
+        text-align: left;
+        background: var(--mantis-surface, rgba(6,18,14,0.85));
+        border: 1px solid var(--mantis-card-border, rgba(148, 163, 184, 0.15));
+        border-radius: 14px;
+        color: var(--mantis-text, #e2e8f0);
+        transition: all 0.2s ease;
+        margin-bottom: 0.75rem;
+    }
+    [class*="st-key-mantis_quick_action_"] .stButton button:hover:not(:disabled) {
+        border-color: var(--mantis-accent-glow, rgba(34,197,94,0.35));
+        transform: translateY(-1px);
+        box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+    }
+    [class*="st-key-mantis_quick_action_"] .stButton button p {
+        font-size: 13px;
+        line-height: 1.4;
+        color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
+    }
+    [class*="st-key-mantis_quick_action_"] .stButton button strong {
+        font-size: 15px;
+        font-weight: 600;
+        color: var(--mantis-text, #e2e8f0);
+    }
+"""
+
+
+_NAV_ITEM = "mantis-nav-item"
+# Item classes indexed by ``is_active + 2 * disabled``.
+_NAV_ITEM_CLASSES = (
+    _NAV_ITEM,
+    _NAV_ITEM + " mantis-nav-item-active",
+    _NAV_ITEM + " mantis-nav-item-disabled",
+    _NAV_ITEM + " mantis-nav-item-active mantis-nav-item-disabled",
+)
+_NAV_ITEM_TMPL = (
+    '<div class="{cls}" data-page="{page}">'
+    '<div class="mantis-nav-icon">{icon}</div>'
+    '<div class="mantis-nav-label">{label}</div>'
+    '{badge}</div>'
+)
+_NAV_BADGE_TMPL = '<span class="mantis-nav-badge">{}</span>'
+_NAV_SECTION_TMPL = (
+    '<div class="mantis-nav-section-container">'
+    '<div class="mantis-nav-section-title">{title}</div>'
+    '<div class="mantis-nav-section-items">{items}</div>'
+    '</div>'
+)
+
+
+def _render_nav_item(item: Dict[str, Any], current_page: str) -> str:
+    """Render one sidebar nav item."""
+    page = item.get('page', '')
+    badge = item.get('badge')
+    disabled = bool(item.get('disabled', False))
+    return _NAV_ITEM_TMPL.format_map({
+        "cls": _NAV_ITEM_CLASSES[(page == current_page) + 2 * disabled],
+        "page": page,
+        "icon": item.get('icon', ''),
+        "label": item.get('label', ''),
+        "badge": _NAV_BADGE_TMPL.format(badge) if badge else '',
+    })
+
+
+def _render_nav_section_html(
+    title: str,
+    items: List[Dict[str, Any]],
+    current_page: str,
+) -> str:
+    items_html = "".join(_render_nav_item(item, current_page) for item in items)
+    return _NAV_SECTION_TMPL.format(title=title, items=items_html)
+
+
+def render_nav_section(
+    title: str,
+    items: List[Dict[str, Any]],
+    current_page: str,
+) -> None:
+    """Render a navigation section in the sidebar with grouped items.
+    
+    Args:
+        title: Section title (e.g., "Core", "Tools", "Settings")
+        items: List of navigation items, each with 'label', 'page', 'icon', optional 'badge'
+        current_page: Currently active page key
     """
-    st.html(html)
+    st.html(_render_nav_section_html(title, items, current_page))
+
+
+def render_nav(
+    sections: Sequence[Tuple[str, List[Dict[str, Any]]]],
+    current_page: str,
+) -> None:
+    """Render several navigation sections with a single ``st.html`` call.
+    
+    Args:
+        sections: ``(title, items)`` pairs, as accepted by ``render_nav_section``
+        current_page: Currently active page key
+    """
+    st.html("".join(
+        _render_nav_section_html(title, items, current_page) for title, items in sections
+    ))
 
 
 def help_tooltip(
@@ -172,36 +269,6 @@ def help_tooltip(
             <div class="mantis-help-text">{text}</div>
         </div>
     </div>
-    <style>
-    .mantis-help-tooltip {{
-        display: flex;
-        gap: 0.75rem;
-        padding: 0.875rem 1rem;
-        background: rgba(56, 189, 248, 0.08);
-        border: 1px solid rgba(56, 189, 248, 0.25);
-        border-radius: 10px;
-        margin: 1rem 0;
-    }}
-    .mantis-help-icon {{
-        font-size: 20px;
-        line-height: 1;
-        flex-shrink: 0;
-    }}
-    .mantis-help-content {{
-        flex: 1;
-    }}
-    .mantis-help-title {{
-        font-weight: 600;
-        font-size: 13px;
-        color: var(--mantis-text, #e2e8f0);
-        margin-bottom: 0.25rem;
-    }}
-    .mantis-help-text {{
-        font-size: 13px;
-        color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
-        line-height: 1.5;
-    }}
-    </style>
     """
     st.html(html)
 
@@ -221,7 +288,7 @@ def quick_action_card(
         title: Card title
         description: Brief description of the action
         icon: Emoji/icon to display
-        action_label: Button label
+        action_label: Call to action shown at the end of the card label
         on_click: Optional callback function
         disabled: Whether the action is disabled
         key: Unique key for the button
@@ -230,58 +297,19 @@ def quick_action_card(
     if key is None:
         key = f"quick_action_{title.lower().replace(' ', '_')}"
     
-    html = f"""
-    <div class="mantis-quick-action-card">
-        <div class="mantis-quick-action-icon">{icon}</div>
-        <div class="mantis-quick-action-content">
-            <div class="mantis-quick-action-title">{title}</div>
-            <div class="mantis-quick-action-desc">{description}</div>
-        </div>
-    </div>
-    <style>
-    .mantis-quick-action-card {{
-        display: flex;
-        align-items: center;
-        gap: 1rem;
-        padding: 1rem 1.25rem;
-        background: var(--mantis-surface, rgba(6,18,14,0.85));
-        border: 1px solid var(--mantis-card-border, rgba(148, 163, 184, 0.15));
-        border-radius: 14px;
-        transition: all 0.2s ease;
-        margin-bottom: 0.75rem;
-    }}
-    .mantis-quick-action-card:hover {{
-        border-color: var(--mantis-accent-glow, rgba(34,197,94,0.35));
-        transform: translateY(-1px);
-        box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-    }}
-    .mantis-quick-action-icon {{
-        font-size: 28px;
-        line-height: 1;
-        flex-shrink: 0;
-    }}
-    .mantis-quick-action-content {{
-        flex: 1;
-    }}
-    .mantis-quick-action-title {{
-        font-weight: 600;
-        font-size: 15px;
-        color: var(--mantis-text, #e2e8f0);
-        margin-bottom: 0.25rem;
-    }}
-    .mantis-quick-action-desc {{
-        font-size: 13px;
-        color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
-        line-height: 1.4;
-    }}
-    </style>
-    """
-    st.html(html)
-    
-    # Render button below the card
-    if st.button(action_label, key=key, disabled=disabled, use_container_width=True, type="primary"):
-        if on_click:
-            on_click()
+    label = f"{icon} **{title}** - {description} | **{action_label}**".strip()
+    # One native button carries the whole card, so each card is a single
+    # element. The keyed container gives NAVIGATION_CSS a hook for the card
+    # styling; Streamlit releases without container keys fall back to a plain
+    # container and a default-styled button.
+    try:
+        holder = st.container(key=f"mantis_quick_action_{key}")
+    except TypeError:
+        holder = st.container()
+    with holder:
+        if st.button(label, key=key, disabled=disabled, use_container_width=True):
+            if on_click:
+                on_click()
 
 
 def empty_state(
@@ -302,50 +330,17 @@ def empty_state(
         on_action: Optional callback for the action button
         key: Unique key for the button
     """
-    action_html = ""
-    if action_label and on_action:
-        if key is None:
-            key = f"empty_state_action_{title.lower().replace(' ', '_')}"
-    
     html = f"""
     <div class="mantis-empty-state">
         <div class="mantis-empty-icon">{icon}</div>
         <div class="mantis-empty-title">{title}</div>
         <div class="mantis-empty-desc">{description}</div>
     </div>
-    <style>
-    .mantis-empty-state {{
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        justify-content: center;
-        text-align: center;
-        padding: 3rem 2rem;
-        margin: 2rem 0;
-    }}
-    .mantis-empty-icon {{
-        font-size: 48px;
-        margin-bottom: 1rem;
-        opacity: 0.7;
-    }}
-    .mantis-empty-title {{
-        font-size: 20px;
-        font-weight: 700;
-        color: var(--mantis-text, #e2e8f0);
-        margin-bottom: 0.5rem;
-    }}
-    .mantis-empty-desc {{
-        font-size: 14px;
-        color: var(--mantis-muted, rgba(226, 232, 240, 0.7));
-        line-height: 1.6;
-        max-width: 400px;
-        margin-bottom: 1.5rem;
-    }}
-    </style>
     """
     st.html(html)
     
     if action_label and on_action:
+        key = key or f"empty_state_action_{title.lower().replace(' ', '_')}"
         if st.button(action_label, key=key, type="primary"):
             on_action()
 
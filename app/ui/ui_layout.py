@@ -1,34 +1,43 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Optional
+from html import escape
+from typing import Optional, Sequence, Tuple
 
 import streamlit as st
 
 
+_SECTION_TMPL = (
+    '<div class="mantis-section-header"><div>'
+    '<div class="mantis-section-title">{title}</div>{subtitle}'
+    '</div></div>'
+)
+_SECTION_CAPTION_TMPL = "<div class='mantis-section-caption'>{}</div>"
+_METRIC_TMPL = (
+    '<div class="mantis-kpi-card">'
+    '<div class="mantis-kpi-label">{label}</div>'
+    '<div class="mantis-kpi-value">{value}</div>'
+    '</div>'
+)
+_METRIC_ROW_TMPL = '<div class="mantis-kpi-grid">{}</div>'
+
+
 def render_section_header(title: str, subtitle: Optional[str] = None) -> None:
-    subtitle_html = f"<div class='mantis-section-caption'>{subtitle}</div>" if subtitle else ""
-    st.html(
-        f"""
-        <div class="mantis-section-header">
-            <div>
-                <div class="mantis-section-title">{title}</div>
-                {subtitle_html}
-            </div>
-        </div>
-        """,
-    )
+    subtitle_html = _SECTION_CAPTION_TMPL.format(escape(subtitle)) if subtitle else ""
+    st.html(_SECTION_TMPL.format(title=escape(title), subtitle=subtitle_html))
 
 
 def render_metric(label: str, value: str) -> None:
-    st.html(
-        f"""
-        <div class="mantis-kpi-card">
-            <div class="mantis-kpi-label">{label}</div>
-            <div class="mantis-kpi-value">{value}</div>
-        </div>
-        """,
+    st.html(_METRIC_TMPL.format(label=escape(str(label)), value=escape(str(value))))
+
+
+def render_metric_row(metrics: Sequence[Tuple[str, str]]) -> None:
+    """Render several KPI cards in one grid with a single ``st.html`` call."""
+    cards = "".join(
+        _METRIC_TMPL.format(label=escape(str(label)), value=escape(str(value)))
+        for label, value in metrics
     )
+    st.html(_METRIC_ROW_TMPL.format(cards))
 
 
 def render_card(title: str, content: Callable[[], None], subtitle: Optional[str] = None) -> None:
@@ -37,3 +46,11 @@ def render_card(title: str, content: Callable[[], None], subtitle: Optional[str]
         if subtitle:
             st.caption(subtitle)
         content()
+
+
+__all__ = [
+    "render_section_header",
+    "render_metric",
+    "render_metric_row",
+    "render_card",
+]
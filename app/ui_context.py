@@ -5,9 +5,13 @@ extracted from the main _run_ui() function to enable modular view development.
 """
 from __future__ import annotations
 
+import base64
 import logging
+import re
 import time
+from collections import defaultdict
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional, Tuple
 
@@ -15,6 +19,53 @@ from app.config.settings import AppConfig
 
 logger = logging.getLogger("MANTIS")
 
+# Cooldowns run on the monotonic clock, whose origin is arbitrary, so an
+# action never marked must compare as infinitely long ago rather than as 0.
+_NEVER = float("-inf")
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# ASCII labels, which are nearly all of them, slugify via str.translate; other
+# text falls back to _SLUG_RE.
+_SLUG_ALLOWED = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+_SLUG_TRANS = str.maketrans({c: "_" for c in map(chr, range(128)) if c not in _SLUG_ALLOWED})
+
+
+# Assets ship with the app and never change while it runs, so each file is
+# read and encoded at most once per process rather than on every rerun.
+@lru_cache(maxsize=64)
+def _read_asset(assets_dir: Path, filename: str) -> Optional[bytes]:
+    path = assets_dir / filename
+    if not path.exists():
+        return None
+    try:
+        return path.read_bytes()
+    except Exception:
+        logger.warning(f"Failed to load asset {path}", exc_info=True)
+        return None
+
+
+@lru_cache(maxsize=64)
+def _encode_asset(assets_dir: Path, filename: str) -> str:
+    payload = _read_asset(assets_dir, filename)
+    if not payload:
+        return ""
+    return base64.b64encode(payload).decode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _debug_secret(st) -> bool:
+    """Read the DEBUG secret once; secrets.toml is fixed for the process."""
+    try:
+        secrets = st.secrets
+    except Exception:
+        return False
+    if isinstance(secrets, dict):
+        return bool(secrets.get("DEBUG"))
+    try:
+        return bool(secrets["DEBUG"])
+    except Exception:
+        return False
+
 
 class UIContext:
     """Shared context for all view rendering functions.
@@ -36,7 +87,7 @@ class UIContext:
             assets_dir: Path to assets directory
         """
         self.st = st
-        self.widget_counters: Dict[Tuple[str, str, str], int] = {}
+        self.widget_counters: Dict[Tuple[str, str, str], int] = defaultdict(int)
         self.key_prefix_stack: List[str] = []
         self.assets_dir = Path(__file__).resolve().parents[1] / "assets"
         
@@ -72,8 +123,11 @@ class UIContext:
     
     def _slugify(self, value: str) -> str:
         """Convert string to slug for widget key."""
-        import re
-        slug = re.sub(r"[^a-z0-9]+", "_", (value or "").lower()).strip("_")
+        text = (value or "").lower()
+        if text.isascii():
+            slug = "_".join(filter(None, text.translate(_SLUG_TRANS).split("_")))
+        else:
+            slug = _SLUG_RE.sub("_", text).strip("_")
         return slug[:40] or "widget"
     
     def auto_key(self, widget_type: str, label: Optional[str], key: Optional[str]) -> str:
@@ -83,8 +137,9 @@ class UIContext:
         prefix = self._current_prefix()
         slug = self._slugify(label or widget_type)
         counter_key = (prefix, widget_type, slug)
-        self.widget_counters[counter_key] = self.widget_counters.get(counter_key, 0) + 1
-        index = self.widget_counters[counter_key]
+        counters = self.widget_counters
+        counters[counter_key] += 1
+        index = counters[counter_key]
         return f"{prefix}__{widget_type}__{slug}__{index}"
     
     def record_action(self, action_label: Optional[str], action_key: Optional[str]) -> None:
@@ -96,35 +151,32 @@ class UIContext:
     def cooldown_remaining(self, action_key: str, seconds: int) -> float:
         """Check cooldown remaining for an action (in seconds)."""
         cooldowns = self.st.session_state.setdefault("_cooldowns", {})
-        last_time = cooldowns.get(action_key, 0.0)
-        elapsed = time.time() - last_time
+        last_time = cooldowns.get(action_key, _NEVER)
+        elapsed = time.monotonic() - last_time
         remaining = max(0.0, seconds - elapsed)
         return remaining
     
     def mark_action(self, action_key: str) -> None:
         """Mark an action as completed (for cooldown tracking)."""
         cooldowns = self.st.session_state.setdefault("_cooldowns", {})
-        cooldowns[action_key] = time.time()
+        cooldowns[action_key] = time.monotonic()
+    
+    def try_action(self, action_key: str, seconds: int) -> bool:
+        """Mark *action_key* and return True unless it is still cooling down."""
+        cooldowns = self.st.session_state.setdefault("_cooldowns", {})
+        now = time.monotonic()
+        if now - cooldowns.get(action_key, _NEVER) < seconds:
+            return False
+        cooldowns[action_key] = now
+        return True
     
     def load_asset_bytes(self, filename: str) -> Optional[bytes]:
-        """Load asset file as bytes (cached via Streamlit)."""
-        # Note: Caching is handled by Streamlit's built-in caching when called through st
-        path = self.assets_dir / filename
-        if not path.exists():
-            return None
-        try:
-            return path.read_bytes()
-        except Exception:
-            logger.warning(f"Failed to load asset {path}", exc_info=True)
-            return None
+        """Load asset file as bytes (cached per process)."""
+        return _read_asset(self.assets_dir, filename)
     
     def asset_base64(self, filename: str) -> str:
         """Load asset and return as base64 string."""
-        import base64
-        payload = self.load_asset_bytes(filename)
-        if not payload:
-            return ""
-        return base64.b64encode(payload).decode("utf-8")
+        return _encode_asset(self.assets_dir, filename)
     
     def persist_project(self, project: Any, *, action: str = "save") -> bool:
         """Save project to local storage."""
@@ -186,18 +238,7 @@ class UIContext:
     
     def debug_enabled(self) -> bool:
         """Check if debug mode is enabled."""
-        try:
-            secrets = self.st.secrets
-        except Exception:
-            secrets = {}
-        
-        if isinstance(secrets, dict):
-            return bool(secrets.get("DEBUG")) or bool(self.st.session_state.get("debug"))
-        
-        try:
-            return bool(secrets["DEBUG"]) or bool(self.st.session_state.get("debug"))
-        except Exception:
-            return bool(self.st.session_state.get("debug"))
+        return _debug_secret(self.st) or bool(self.st.session_state.get("debug"))
 
 
 def create_ui_context(st) -> UIContext:
@@ -498,9 +498,7 @@ def is_authenticated(session_state: Any = None) -> bool:
 
 
 def get_current_user(session_state: Any = None) -> Optional[Dict[str, Any]]:
-    if session_state is None:
-        return None
-    if not is_authenticated(session_state):
+    if session_state is None or not session_state.get("user_id"):
         return None
     return {
         "id": session_state.get("user_id"),
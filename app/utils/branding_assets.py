@@ -6,8 +6,10 @@ individual branding elements derived from the master brand board.
 
 from __future__ import annotations
 
+import os
+import threading
 from pathlib import Path
-from typing import Optional, Set
+from typing import Dict, Optional, Set, Tuple
 
 try:
     from PIL import Image, ImageChops
@@ -15,6 +17,19 @@ except Exception:  # pragma: no cover - defensive dependency fallback
     Image = None  # type: ignore[assignment]
     ImageChops = None  # type: ignore[assignment]
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - defensive dependency fallback
+    np = None  # type: ignore[assignment]
+
+# Slices are written once and then served from disk, so favour write speed:
+# zlib level 1 without optimize is several times faster than level 9 for a
+# file only slightly larger. MANTIS_BRANDING_PNG_LEVEL (0-9) overrides it.
+try:
+    _PNG_COMPRESS_LEVEL = min(9, max(0, int(os.getenv("MANTIS_BRANDING_PNG_LEVEL", "1"))))
+except ValueError:
+    _PNG_COMPRESS_LEVEL = 1
+
 # Crop boxes are measured against the 1536x1024 source image and represent
 # high-resolution (2x) slices.
 _BRANDING_SPECS = {
@@ -58,6 +73,14 @@ _ASSET_ALIASES = {
 }
 
 
+# Process-local memo of generated slices and asset bytes, keyed by
+# (assets_dir, filename) and validated against the source mtime so that
+# Streamlit reruns skip the disk and PIL work once an asset is known.
+_PATH_CACHE: Dict[Tuple[str, str], Tuple[int, Path]] = {}
+_BYTES_CACHE: Dict[Tuple[str, str], Tuple[int, bytes]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
 def _generated_dir(assets_dir: Path) -> Path:
     return assets_dir / ".generated_branding"
 
@@ -106,6 +129,19 @@ def _resolve_direct_asset_path(
     return None
 
 
+def _alpha_curve(v: int, floor: int = 20, ceiling: int = 150) -> int:
+    if v <= floor:
+        return 0
+    if v >= ceiling:
+        return 255
+    return int((v - floor) * 255 / (ceiling - floor))
+
+
+# Brightness -> alpha lookup table, built once rather than per slice.
+_ALPHA_LUT = bytes(_alpha_curve(v) for v in range(256))
+_ALPHA_LUT_NP = np.frombuffer(_ALPHA_LUT, dtype=np.uint8) if np is not None else None
+
+
 def _extract_alpha_mask(image: "Image.Image") -> "Image.Image":
     """Build alpha from brightness to remove the dark board background.
 
@@ -113,24 +149,24 @@ def _extract_alpha_mask(image: "Image.Image") -> "Image.Image":
     so branding elements integrate with the app theme instead of appearing as
     hard-edged rectangles from the source board.
     """
+    if np is not None:
+        max_rgb = np.asarray(image, dtype=np.uint8)[..., :3].max(axis=2)
+        alpha = _ALPHA_LUT_NP[max_rgb]
+        return Image.fromarray(alpha)
+
     r, g, b, _ = image.split()
     max_rgb = ImageChops.lighter(ImageChops.lighter(r, g), b)
-
-    floor = 20
-    ceiling = 150
-
-    def alpha_curve(v: int) -> int:
-        if v <= floor:
-            return 0
-        if v >= ceiling:
-            return 255
-        return int((v - floor) * 255 / (ceiling - floor))
-
-    return max_rgb.point(alpha_curve)
+    return max_rgb.point(list(_ALPHA_LUT))
 
 
 def _prepare_branding_slice(image: "Image.Image") -> "Image.Image":
     rgba = image.convert("RGBA")
+    if np is not None:
+        # One RGBA buffer: the alpha channel is rewritten in place rather than
+        # built as a separate mask image and copied back with putalpha.
+        pixels = np.array(rgba)
+        pixels[..., 3] = _ALPHA_LUT_NP[pixels[..., :3].max(axis=2)]
+        return Image.fromarray(pixels)
     alpha = _extract_alpha_mask(rgba)
     rgba.putalpha(alpha)
     return rgba
@@ -159,24 +195,39 @@ def ensure_branding_asset(assets_dir: Path, filename: str) -> Optional[Path]:
     if source is None:
         return None
 
+    cache_key = (str(assets_dir), filename)
+    src_mtime_ns = source.stat().st_mtime_ns
+    with _CACHE_LOCK:
+        cached = _PATH_CACHE.get(cache_key)
+    if cached is not None and cached[0] == src_mtime_ns:
+        if cached[1].exists():
+            return cached[1]
+        # The generated slice was removed; drop the entry and regenerate it.
+        with _CACHE_LOCK:
+            _PATH_CACHE.pop(cache_key, None)
+
     out_dir = _generated_dir(assets_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / leaf
 
-    if out_path.exists() and out_path.stat().st_mtime >= source.stat().st_mtime:
+    if out_path.exists() and out_path.stat().st_mtime_ns >= src_mtime_ns:
+        with _CACHE_LOCK:
+            _PATH_CACHE[cache_key] = (src_mtime_ns, out_path)
         return out_path
 
     crop_box = _BRANDING_SPECS[base_name]
-    with Image.open(source).convert("RGBA") as src:
-        cropped = src.crop(crop_box)
-        processed = _prepare_branding_slice(cropped)
+    with Image.open(source) as src:
+        # Crop before converting so only the slice is expanded to RGBA.
+        processed = _prepare_branding_slice(src.crop(crop_box))
         if not retina:
             processed = processed.resize(
                 (max(1, processed.width // 2), max(1, processed.height // 2)),
                 Image.Resampling.LANCZOS,
             )
-        processed.save(out_path, optimize=True, compress_level=9)
+        processed.save(out_path, optimize=False, compress_level=_PNG_COMPRESS_LEVEL)
 
+    with _CACHE_LOCK:
+        _PATH_CACHE[cache_key] = (src_mtime_ns, out_path)
     return out_path
 
 
@@ -189,7 +240,16 @@ def read_asset_bytes(assets_dir: Path, filename: str) -> Optional[bytes]:
             return None
         path = generated
 
-    return path.read_bytes()
+    cache_key = (str(assets_dir), filename)
+    mtime_ns = path.stat().st_mtime_ns
+    with _CACHE_LOCK:
+        cached = _BYTES_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    payload = path.read_bytes()
+    with _CACHE_LOCK:
+        _BYTES_CACHE[cache_key] = (mtime_ns, payload)
+    return payload
 
 
 def resolve_asset_path(assets_dir: Path, filename: str) -> Optional[Path]:
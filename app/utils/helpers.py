@@ -19,52 +19,48 @@ def current_year() -> int:
     return datetime.datetime.now(datetime.timezone.utc).year
 
 
-def _has_any_api_key(ss) -> bool:
-    """Return ``True`` when at least one AI provider key is present."""
-    # Explicit flags set elsewhere in the app.
-    if ss.get("ai_configured"):
-        return True
-    if ss.get("api_keys"):
-        return True
-    if ss.get("providers"):
-        return True
+# Session keys that signal a configured provider when truthy: explicit flags
+# set elsewhere in the app, then the resolved keys written by
+# initialize_session_state.
+_KEY_FLAG_KEYS = ("ai_configured", "api_keys", "providers", "groq_api_key", "openai_api_key")
+# Provider -> key dicts: ai_keys from the connect UI, and ai_session_keys,
+# the primary storage used by get_effective_key.
+_KEY_DICT_KEYS = ("ai_keys", "ai_session_keys")
+# Non-empty model test results or fetched model lists, by expected type.
+_TESTED_CONTAINER_KEYS = (
+    ("groq_model_tests", dict),
+    ("openai_model_tests", dict),
+    ("groq_model_list", list),
+    ("openai_model_list", list),
+)
+_TESTED_FLAG_KEYS = ("groq_connection_tested", "openai_connection_tested")
 
-    # ai_keys dict populated when the user connects a provider via the UI.
-    ai_keys = ss.get("ai_keys")
-    if isinstance(ai_keys, dict) and any(ai_keys.values()):
-        return True
 
-    # ai_session_keys is the primary key storage used by get_effective_key.
-    session_keys = ss.get("ai_session_keys")
-    if isinstance(session_keys, dict) and any(session_keys.values()):
-        return True
-
-    # Fallback: check resolved API keys written by initialize_session_state.
-    if ss.get("groq_api_key") or ss.get("openai_api_key"):
+def _has_any_api_key(ss) -> bool:
+    """Return ``True`` when at least one AI provider key is present."""
+    if any(ss.get(key) for key in _KEY_FLAG_KEYS):
         return True
-
+    for key in _KEY_DICT_KEYS:
+        keys = ss.get(key)
+        if isinstance(keys, dict) and any(keys.values()):
+            return True
     return False
 
 
 def _has_tested_connection(ss) -> bool:
     """Return ``True`` when the user has tested at least one provider."""
-    groq_tests = ss.get("groq_model_tests")
-    if isinstance(groq_tests, dict) and groq_tests:
-        return True
-    openai_tests = ss.get("openai_model_tests")
-    if isinstance(openai_tests, dict) and openai_tests:
-        return True
-    groq_models = ss.get("groq_model_list")
-    if isinstance(groq_models, list) and groq_models:
-        return True
-    openai_models = ss.get("openai_model_list")
-    if isinstance(openai_models, list) and openai_models:
-        return True
-    if ss.get("groq_connection_tested"):
-        return True
-    if ss.get("openai_connection_tested"):
-        return True
-    return False
+    for key, kind in _TESTED_CONTAINER_KEYS:
+        value = ss.get(key)
+        if isinstance(value, kind) and value:
+            return True
+    return any(ss.get(key) for key in _TESTED_FLAG_KEYS)
+
+
+def _ai_key_status(ss) -> tuple[bool, bool]:
+    """Return ``(has_key, tested)``; ``tested`` is only probed when a key exists."""
+    if not _has_any_api_key(ss):
+        return False, False
+    return True, _has_tested_connection(ss)
 
 
 def _attempt_connection_probe(ss) -> bool:
@@ -118,8 +114,9 @@ def ai_connection_warning(st) -> None:
     back to the resolved ``groq_api_key`` / ``openai_api_key`` values.
     """
     ss = st.session_state
+    has_key, tested = _ai_key_status(ss)
 
-    if not _has_any_api_key(ss):
+    if not has_key:
         st.warning(
             "AI providers are not connected. "
             "Automatic title and genre generation along with all AI "
@@ -131,7 +128,6 @@ def ai_connection_warning(st) -> None:
         return
 
     # Keys exist but connection has not been verified yet.
-    tested = _has_tested_connection(ss)
     if not tested:
         tested = _attempt_connection_probe(ss)
 
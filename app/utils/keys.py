@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Optional
 
+_SLUG_RE = re.compile(r"[^a-z0-9_]+")
+_SAFE_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
 
+
+@lru_cache(maxsize=4096)
 def _slugify(value: str) -> str:
-    cleaned = re.sub(r"[^a-z0-9_]+", "_", (value or "").lower()).strip("_")
-    return cleaned or "key"
+    lowered = (value or "").lower()
+    if _SAFE_CHARS.issuperset(lowered):
+        return lowered.strip("_") or "key"
+    return _SLUG_RE.sub("_", lowered).strip("_") or "key"
 
 
 def ui_key(*parts: Optional[str]) -> str:
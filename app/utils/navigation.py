@@ -1,8 +1,9 @@
 ﻿from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
-NAV_ITEMS: List[Tuple[str, str, str]] = [
+NAV_ITEMS: Tuple[Tuple[str, str, str], ...] = (
     ("Dashboard", "home", ""),
     ("Projects", "projects", ""),
     ("Outline", "outline", ""),
@@ -12,7 +13,7 @@ NAV_ITEMS: List[Tuple[str, str, str]] = [
     ("Insights", "insights", ""),
     ("Memory", "memory", ""),
     ("AI Settings", "ai", ""),
-]
+)
 
 NAV_SECTIONS: List[Tuple[str, List[Tuple[str, str, str]]]] = [
     ("Workflow", [
@@ -39,19 +40,22 @@ EXTENDED_MAP: Dict[str, str] = {
     "Insights": "insights",
 }
 
-_DEFAULT_NAV_LABELS: List[str] = [label for label, _, _ in NAV_ITEMS]
+# Frozen so get_nav_config can hand them out without copying on every rerun;
+# callers that need to mutate should copy them themselves.
+_DEFAULT_NAV_LABELS: Tuple[str, ...] = tuple(label for label, _, _ in NAV_ITEMS)
 
-_DEFAULT_MAP: Dict[str, str] = {label: key for label, key, _ in NAV_ITEMS}
-_DEFAULT_MAP.update(EXTENDED_MAP)
+_DEFAULT_MAP: Mapping[str, str] = MappingProxyType(
+    {**{label: key for label, key, _ in NAV_ITEMS}, **EXTENDED_MAP}
+)
 
 
-def get_nav_config(has_project: bool) -> Tuple[List[str], Dict[str, str]]:
+def get_nav_config(has_project: bool) -> Tuple[Tuple[str, ...], Mapping[str, str]]:
     del has_project
-    return list(_DEFAULT_NAV_LABELS), dict(_DEFAULT_MAP)
+    return _DEFAULT_NAV_LABELS, _DEFAULT_MAP
 
 
-def get_nav_items() -> List[Tuple[str, str, str]]:
-    return list(NAV_ITEMS)
+def get_nav_items() -> Tuple[Tuple[str, str, str], ...]:
+    return NAV_ITEMS
 
 
 def get_nav_sections() -> List[Tuple[str, List[Tuple[str, str, str]]]]:
@@ -1,12 +1,25 @@
+from functools import lru_cache
 from pathlib import Path
 
 DEFAULT_APP_VERSION = "136.9"
 
+_VERSION_PATH = Path(__file__).resolve().parents[2] / "VERSION.txt"
 
-def get_app_version() -> str:
-    version_path = Path(__file__).resolve().parents[2] / "VERSION.txt"
+
+def get_app_version(force_refresh: bool = False) -> str:
+    """Return the app version from VERSION.txt, read once per process.
+
+    Pass ``force_refresh=True`` to re-read the file after bumping it.
+    """
+    if force_refresh:
+        _read_app_version.cache_clear()
+    return _read_app_version()
+
+
+@lru_cache(maxsize=1)
+def _read_app_version() -> str:
     try:
-        version = version_path.read_text(encoding="utf-8").strip()
+        version = _VERSION_PATH.read_text(encoding="utf-8").strip()
     except FileNotFoundError:
         return DEFAULT_APP_VERSION
     except OSError:
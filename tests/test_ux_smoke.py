@@ -359,10 +359,10 @@ class TestNavigationParity:
         assert "World Bible" in labels
         assert "AI Settings" in labels
 
-    def test_get_nav_items_returns_list_of_tuples(self):
+    def test_get_nav_items_returns_tuple_of_tuples(self):
         from app.utils.navigation import get_nav_items
         items = get_nav_items()
-        assert isinstance(items, list)
+        assert isinstance(items, tuple)
         assert len(items) >= 6
         for item in items:
             assert len(item) == 3, "Each item must be (label, page_key, icon)"
@@ -396,7 +396,7 @@ class TestNavigationParity:
         from app.router import get_nav_config
 
         labels, pmap = get_nav_config(True)
-        expected_labels = [label for label, _, _ in NAV_ITEMS]
+        expected_labels = tuple(label for label, _, _ in NAV_ITEMS)
         assert labels == expected_labels
 
         for label, page_key, _ in NAV_ITEMS:
@@ -1546,6 +1546,14 @@ class TestLayoutConsolidation:
         from app.layout.layout import _CURRENT_YEAR
         assert _CURRENT_YEAR >= 2026
 
+    def test_footer_html_is_cached_per_inputs(self):
+        from app.layout.layout import _render_footer_html
+        first = _render_footer_html("1.0.0", "https://example.com/issues", "team@example.com", 2026)
+        assert "v1.0.0" in first
+        assert "2026 MANTIS Studio" in first
+        assert _render_footer_html("1.0.0", "https://example.com/issues", "team@example.com", 2026) is first
+        assert _render_footer_html("1.0.0", "https://example.com/issues", "team@example.com", 2027) is not first
+
 class TestOAuthAndRepoStructure:
     """OAuth and repo organization should live in dedicated modules."""
 
@@ -1946,6 +1954,30 @@ class TestHtmlRendering:
         source = path.read_text(encoding="utf-8")
         assert "st.html(" in source, "app/ui/components.py should use st.html()"
 
+    def test_tag_list_html_is_cached_per_tuple(self):
+        """Identical tag tuples should reuse the same pill markup."""
+        from app.ui.components import _tags_html
+
+        first = _tags_html(("Hero", "", "Rogue"))
+        assert first.count("mantis-pill") == 2
+        assert _tags_html(("Hero", "", "Rogue")) is first
+        assert _tags_html(("", "")) == ""
+
+    def test_components_escape_user_text(self, monkeypatch):
+        """User-supplied titles and tags must not be injected as raw HTML."""
+        import streamlit as st
+        from app.ui import components
+
+        rendered: list[str] = []
+        monkeypatch.setattr(st, "html", lambda body, **_: rendered.append(body))
+        components.cta_tile("<b>Draft</b>", "Tom & Jerry")
+        components.render_tag_list(["<script>x</script>"])
+        joined = "\n".join(rendered)
+        assert "<b>Draft</b>" not in joined
+        assert "&lt;b&gt;Draft&lt;/b&gt;" in joined
+        assert "Tom &amp; Jerry" in joined
+        assert "<script>" not in joined
+
     def test_buttons_use_st_html(self):
         """Button components should use st.html() for HTML rendering."""
         path = ROOT / "app" / "components" / "buttons.py"
@@ -1958,6 +1990,57 @@ class TestHtmlRendering:
         source = path.read_text(encoding="utf-8")
         assert "st.html(" in source, "app/ui/enhanced_theme.py should use st.html()"
 
+    def test_theme_payload_is_cached_per_theme(self, monkeypatch):
+        """Repeated injections should reuse the assembled stylesheet."""
+        import streamlit as st
+        from app.ui import enhanced_theme
+
+        rendered: list[str] = []
+        monkeypatch.setattr(st, "html", lambda body, **_: rendered.append(body))
+        enhanced_theme.inject_enhanced_theme("Light")
+        enhanced_theme.inject_enhanced_theme("Dark")
+        enhanced_theme.inject_enhanced_theme("Light")
+        assert rendered[2] is rendered[0]
+        assert "Final Light-Mode Enforcement Layer" in rendered[0]
+        assert "Final Light-Mode Enforcement Layer" not in rendered[1]
+
+    def test_theme_payload_rebuilds_when_styles_change(self):
+        """A new styles.css mtime should produce a fresh payload."""
+        from app.ui import enhanced_theme
+
+        before = enhanced_theme._assemble("Dark", 1)
+        assert enhanced_theme._assemble("Dark", 1) is before
+        assert enhanced_theme._assemble("Dark", 2) is not before
+
+    def test_nav_section_css_ships_with_theme(self, monkeypatch):
+        """Nav sections should emit markup only; their CSS is in the theme."""
+        import streamlit as st
+        from app.ui import enhanced_theme, navigation
+
+        rendered: list[str] = []
+        monkeypatch.setattr(st, "html", lambda body, **_: rendered.append(body))
+        navigation.render_nav_section("Core", [{"label": "Home", "page": "home"}], "home")
+        assert "mantis-nav-item-active" in rendered[0]
+        assert "<style>" not in rendered[0]
+        assert ".mantis-nav-item-active" in enhanced_theme._assemble("Dark")
+
+    def test_batched_renderers_emit_one_element(self, monkeypatch):
+        """Metric rows and multi-section nav should use a single st.html call."""
+        import streamlit as st
+        from app.ui import navigation, ui_layout
+
+        rendered: list[str] = []
+        monkeypatch.setattr(st, "html", lambda body, **_: rendered.append(body))
+        ui_layout.render_metric_row([("Words", "1,200"), ("Chapters", "<b>4</b>")])
+        navigation.render_nav(
+            [("Core", [{"label": "Home", "page": "home"}]), ("Tools", [{"label": "Export", "page": "export"}])],
+            "home",
+        )
+        assert len(rendered) == 2
+        assert rendered[0].count("mantis-kpi-card") == 2
+        assert "&lt;b&gt;4&lt;/b&gt;" in rendered[0]
+        assert rendered[1].count("mantis-nav-section-container") == 2
+
     def test_theme_does_not_inject_scroll_to_top(self):
         """Theme injection should not force scroll position."""
         path = ROOT / "app" / "ui" / "enhanced_theme.py"
@@ -2781,3 +2864,188 @@ class TestWidgetWrapGuard:
         assert first_wrapper is second_wrapper, (
             "install_key_helpers double-wrapped selectbox"
         )
+
+    def test_install_key_helpers_reuses_helpers_and_resets_counters(self):
+        """Reruns reuse the installed helpers but start keys from 1 again."""
+        from types import SimpleNamespace
+        from app.state import install_key_helpers
+
+        mock_st = SimpleNamespace(
+            text_input=lambda label, **kwargs: kwargs["key"],
+            session_state={},
+        )
+        key_scope, counters = install_key_helpers(mock_st)
+        with key_scope("page"):
+            assert mock_st.text_input("Title") == "page__title__1"
+            assert mock_st.text_input("Title") == "page__title__2"
+        assert counters[("page", "text_input", "title")] == 2
+
+        second_scope, second_counters = install_key_helpers(mock_st)
+        assert second_scope is key_scope
+        assert second_counters is counters
+        assert not second_counters
+        with key_scope("page"):
+            assert mock_st.text_input("Title") == "page__title__1"
+
+    def test_key_scopes_are_isolated_per_session(self):
+        """Sessions share the installed helpers but not their key-scope stack."""
+        from types import SimpleNamespace
+        from app.state import install_key_helpers
+
+        session_a: dict = {}
+        session_b: dict = {}
+        mock_st = SimpleNamespace(
+            text_input=lambda label, **kwargs: kwargs["key"],
+            session_state=session_a,
+        )
+        key_scope, _ = install_key_helpers(mock_st)
+        with key_scope("editor"):
+            mock_st.session_state = session_b
+            assert mock_st.text_input("Title") == "global__title__1"
+            mock_st.session_state = session_a
+            assert mock_st.text_input("Title") == "editor__title__1"
+
+
+# ---------------------------------------------------------------------------
+# Dashboard components
+# ---------------------------------------------------------------------------
+
+
+class TestDashboardComponents:
+    """Verify the dashboard render helpers batch and escape their markup."""
+
+    def test_activity_feed_builds_single_escaped_block(self):
+        from app.ui.dashboard_components import _build_activity_feed_html
+
+        markup = _build_activity_feed_html(
+            (("09:00", "Info", "<b>Saved</b>"), ("Live", "System", "Cloud mode"))
+        )
+        assert markup.startswith('<div class="mantis-activity-feed">')
+        assert markup.count("mantis-activity-item") == 2
+        assert "&lt;b&gt;Saved&lt;/b&gt;" in markup
+
+    def test_activity_feed_renders_single_escaped_block(self, monkeypatch):
+        import streamlit as st
+        from app.ui import dashboard_components
+
+        rendered: list[str] = []
+        monkeypatch.setattr(st, "markdown", lambda *args, **kwargs: None)
+        monkeypatch.setattr(st, "html", lambda body, **_: rendered.append(body))
+        dashboard_components.render_activity_feed(
+            [("09:00", "Info", "<b>Saved</b>"), ("Live", "System", "Cloud mode")]
+        )
+        assert len(rendered) == 1
+        assert rendered[0].count("mantis-activity-item") == 2
+        assert "&lt;b&gt;Saved&lt;/b&gt;" in rendered[0]
+
+    def test_escape_helper_returns_plain_text_unchanged(self):
+        from app.ui.dashboard_components import _esc
+
+        plain = "Cloud mode - autosave on"
+        assert _esc(plain) is plain
+        assert _esc("Tom & <Jerry>") == "Tom &amp; &lt;Jerry&gt;"
+
+
+# ---------------------------------------------------------------------------
+# Feedback components
+# ---------------------------------------------------------------------------
+
+
+class TestFeedbackComponents:
+    """Verify the feedback helpers emit the expected markup."""
+
+    def test_step_indicator_marks_each_step_state(self, monkeypatch):
+        import streamlit as st
+        from app.ui import feedback
+
+        rendered: list[str] = []
+        monkeypatch.setattr(st, "html", lambda body, **_: rendered.append(body))
+        feedback.step_indicator(["Outline", "Draft", "Revise"], current_step=1)
+        markup = rendered[0].split("<style>", 1)[0]
+        assert markup.count('class="mantis-step ') == 3
+        assert "mantis-step-completed" in markup
+        assert "mantis-step-current" in markup
+        assert "mantis-step-future" in markup
+        assert markup.count("mantis-step-connector-completed") == 1
+        assert markup.count('class="mantis-step-connector') == 2
+
+    def test_feedback_helpers_escape_caller_text(self, monkeypatch):
+        import streamlit as st
+        from app.ui import feedback
+
+        rendered: list[str] = []
+        monkeypatch.setattr(st, "html", lambda body, **_: rendered.append(body))
+        feedback.feedback_message("<img src=x onerror=alert(1)>", "error")
+        feedback.page_header("Tom & Jerry", breadcrumbs=["<b>Home</b>"])
+        joined = "\n".join(rendered)
+        assert "<img src=x" not in joined
+        assert "&lt;img src=x onerror=alert(1)&gt;" in joined
+        assert "Tom &amp; Jerry" in joined
+        assert "&lt;b&gt;Home&lt;/b&gt;" in joined
+
+    def test_feedback_batch_emits_one_element(self, monkeypatch):
+        import streamlit as st
+        from app.ui import feedback
+
+        rendered: list[str] = []
+        monkeypatch.setattr(st, "html", lambda body, **_: rendered.append(body))
+        with feedback.feedback_batch():
+            feedback.page_header("Import")
+            with feedback.feedback_batch():
+                feedback.step_indicator(["Upload", "Analyze"], current_step=0)
+            assert rendered == []
+        assert len(rendered) == 1
+        assert "mantis-page-title" in rendered[0]
+        assert "mantis-step-indicator" in rendered[0]
+        feedback.loading_state("Working")
+        assert len(rendered) == 2
+
+    def test_keyed_progress_updates_are_throttled(self, monkeypatch):
+        import streamlit as st
+        from app.ui import feedback
+
+        rendered: list[str] = []
+        monkeypatch.setattr(st, "html", lambda body, **_: rendered.append(body))
+        monkeypatch.setattr(st, "session_state", {})
+        clock = iter([10.0, 10.02, 10.03, 10.05])
+        monkeypatch.setattr(feedback.time, "monotonic", lambda: next(clock))
+        feedback.progress_bar_with_message(0.1, "Working", key="import")
+        feedback.progress_bar_with_message(0.2, "Working", key="import")
+        feedback.progress_bar_with_message(1.0, "Done", key="import")
+        feedback.progress_bar_with_message(0.3, "Again", key="import")
+        # Throttled calls re-emit the last bar so it survives the rerun.
+        assert len(rendered) == 4
+        assert rendered[1] is rendered[0]
+        assert 'data-complete="false"' in rendered[0]
+        assert "100%" in rendered[2]
+        assert 'data-complete="true"' in rendered[2]
+        assert rendered[3] is rendered[2]
+
+    def test_step_renderer_matches_step_indicator(self, monkeypatch):
+        import streamlit as st
+        from app.ui import feedback
+
+        rendered: list[str] = []
+        monkeypatch.setattr(st, "html", lambda body, **_: rendered.append(body))
+        steps = ["Upload File", "Create Project", "Analyze"]
+        render = feedback.make_step_renderer(steps)
+        render(2, [0])
+        feedback.step_indicator(steps, 2, [0])
+        assert rendered[0] == rendered[1]
+        assert 'class="mantis-step"' in rendered[0]
+
+
+class TestBrandingAssets:
+    """Tests for generated branding slices."""
+
+    def test_deleted_slice_is_regenerated(self, tmp_path):
+        """A cached slice path must not outlive the file on disk."""
+        Image = pytest.importorskip("PIL.Image")
+        from app.utils import branding_assets
+
+        Image.new("RGB", (1536, 1024), (200, 220, 200)).save(tmp_path / "NEW MANTIS BRANDING.png")
+        first = branding_assets.ensure_branding_asset(tmp_path, "branding/mantis_emblem.png")
+        assert first is not None and first.exists()
+        first.unlink()
+        again = branding_assets.ensure_branding_asset(tmp_path, "branding/mantis_emblem.png")
+        assert again is not None and again.exists()